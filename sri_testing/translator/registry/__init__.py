@@ -2,9 +2,10 @@
 Translator SmartAPI Registry access module.
 """
 from functools import lru_cache
-from typing import Optional, Union, List, Dict, NamedTuple, Set, Tuple, Any, Generator
+from typing import Optional, Union, List, Dict, NamedTuple, Set, FrozenSet, Tuple, Any, Generator, Sequence
 from datetime import datetime
 
+import orjson
 import requests
 import yaml
 from reasoner_validator.versioning import SemVer
@@ -13,7 +14,7 @@ from requests.exceptions import RequestException
 
 import logging
 
-from tests.translator.registry import MOCK_REGISTRY, MOCK_TRANSLATOR_SMARTAPI_REGISTRY_METADATA
+from tests.translator.registry import is_mock_registry, get_mock_registry_metadata
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,10 @@ SMARTAPI_QUERY_PARAMETERS = "q=__all__&tags=%22trapi%22&" + \
 
 MINIMUM_BIOLINK_VERSION = "2.2.11"  # use RTX-KG2 as the minimum version
 
+# HTTP session shared by the Registry, test data and TRAPI endpoint requests of this module,
+# so that connections (and their TLS sessions) to a given host are reused across requests
+_http_session: requests.Session = requests.Session()
+
 
 def set_timestamp():
     dtnow = datetime.now()
@@ -36,7 +41,7 @@ def set_timestamp():
 def get_spec(spec_url):
     spec = None
     try:
-        meta_data = requests.get(spec_url)
+        meta_data = _http_session.get(spec_url)
         if ".json" in spec_url:
             spec = meta_data.json()
         elif ".yml" in spec_url or ".yaml" in spec_url:
@@ -49,7 +54,7 @@ def get_spec(spec_url):
 def get_status(url, meta_path):
     status = None
     try:
-        request = requests.get(url + meta_path)
+        request = _http_session.get(url + meta_path)
         status = request.status_code
     except Exception as e:
         print(e)
@@ -68,22 +73,23 @@ def query_smart_api(url: str = SMARTAPI_URL, parameters: Optional[str] = None) -
     query_string = f"query?{parameters}" if parameters else "query"
     data: Optional[Dict] = None
     try:
-        if MOCK_REGISTRY:
+        if is_mock_registry():
             # TODO: Using Mock data for now given that the "real" repository
             #       currently lacks KP and ARA 'test_data_location' tags.
             # double deak: fake special "fake URL" unit test result
             if url == "fake URL":
                 raise RequestException(f"fake URL!")
 
-            data = MOCK_TRANSLATOR_SMARTAPI_REGISTRY_METADATA
+            data = get_mock_registry_metadata()
 
         else:
 
-            request = requests.get(f"{url}{query_string}")
+            request = _http_session.get(f"{url}{query_string}")
             if request.status_code == 200:
-                data = request.json()
+                # the (multi-megabyte) Registry catalog is parsed with the (much faster) orjson library
+                data = orjson.loads(request.content)
 
-    except RequestException as re:
+    except (RequestException, orjson.JSONDecodeError) as re:
         print(re)
         data = {"Error": "Translator SmartAPI Registry Access Exception: "+str(re)}
 
@@ -134,19 +140,18 @@ def load_specs() -> Generator:
         yield service
 
 
-def get_nested_tag_value(data: Dict, path: List[str], pos: int) -> Optional[str]:
+def get_nested_tag_value(data: Dict, path: Sequence[str], pos: int) -> Optional[str]:
     """
     Navigate dot delimited tag 'path' into a multi-level dictionary, to return its associated value.
 
     :param data: Dict, multi-level data dictionary
-    :param path: str, dotted JSON tag path
+    :param path: Sequence[str], dotted JSON tag path, split into its tags
     :param pos: int, zero-based current position in tag path
     :return: string value of the multi-level tag, if available; 'None' otherwise if no tag value found in the path
     """
     tag = path[pos]
-    part_tag_path = ".".join(path[:pos+1])
     if tag not in data:
-        logger.debug(f"\tMissing tag path '{part_tag_path}'?")
+        logger.debug(f"\tMissing tag path '{'.'.join(path[:pos+1])}'?")
         return None
 
     pos += 1
@@ -156,6 +161,17 @@ def get_nested_tag_value(data: Dict, path: List[str], pos: int) -> Optional[str]
         return get_nested_tag_value(data[tag], path, pos)
 
 
+@lru_cache(maxsize=256)
+def _split_tag_path(tag_path: str) -> Tuple[str, ...]:
+    """
+    Splits a dotted JSON tag path into its tags, only once per distinct tag path.
+
+    :param tag_path: str, dotted JSON tag path
+    :return: Tuple[str, ...], tags of the tag path
+    """
+    return tuple(tag_path.split("."))
+
+
 def tag_value(json_data, tag_path) -> Optional[str]:
     """
 
@@ -167,8 +183,7 @@ def tag_value(json_data, tag_path) -> Optional[str]:
         logger.debug(f"\tEmpty 'tag_path' argument?")
         return None
 
-    parts = tag_path.split(".")
-    return get_nested_tag_value(json_data, parts, 0)
+    return get_nested_tag_value(json_data, _split_tag_path(tag_path), 0)
 
 
 def capture_tag_value(service_metadata: Dict, resource: str, tag: str, value: str):
@@ -187,11 +202,13 @@ def capture_tag_value(service_metadata: Dict, resource: str, tag: str, value: st
         service_metadata[resource][tag] = None
 
 
+@lru_cache(maxsize=1024)
 def rewrite_github_url(url: str) -> str:
     """
     If the URL is a regular GitHub page specification of a file, then rewrite
     the URL to point to the corresponding https://raw.githubusercontent.com.
     Non-Github URLs and raw.githubusercontent.com URLs themselves are simply returned unaltered.
+    Registry entries often share test data URLs, so each distinct URL is only rewritten once.
 
     :param url: input url
     :return:
@@ -228,7 +245,7 @@ def validate_url(url: str) -> Optional[str]:
         test_data_location = rewrite_github_url(url)
 
         try:
-            request = requests.get(test_data_location)
+            request = _http_session.get(test_data_location)
             if request.status_code == 200:
                 # Success! return the successfully accessed
                 # (possibly rewritten) test_data_location URL
@@ -259,6 +276,10 @@ def _select_url(urls: Optional[Union[str, List, Dict]]) -> Optional[str]:
     return rewrite_github_url(simple_raw_url) if simple_raw_url else None
 
 
+# x_maturity precedence order of the test data location selected by get_default_url()
+_DEFAULT_URL_X_MATURITY_PRECEDENCE: Tuple[str, ...] = ('default', 'production', 'staging', 'testing', 'development')
+
+
 def get_default_url(test_data_location: Optional[Union[str, List, Dict]]) -> Optional[str]:
     """
     This method selects a default test_data_location url for use in test data / configuration retrieval.
@@ -269,20 +290,16 @@ def get_default_url(test_data_location: Optional[Union[str, List, Dict]]) -> Opt
     :param test_data_location: Optional[Union[str, List, Dict]]
     :return: a single resolved URL to a REST JSON file - KP test data or ARA test configuration; None if not available
     """
-    resolved_url: Optional[str] = _select_url(test_data_location)
-    if resolved_url:
-        return resolved_url
-    elif isinstance(test_data_location, Dict):
-        urls: Optional[Union[str, List[str]]] = None
+    if isinstance(test_data_location, Dict):
         # assume an x_maturity precedence order
-        for x_maturity in ['default', 'production', 'staging', 'testing', 'development']:
+        for x_maturity in _DEFAULT_URL_X_MATURITY_PRECEDENCE:
             if x_maturity in test_data_location:
-                urls = test_data_location[x_maturity]
-                break
-        return _select_url(urls)
-    else:
+                return _select_url(test_data_location[x_maturity])
         # fall through failure
         return None
+    else:
+        # simple string or list of string URLs (or None)
+        return _select_url(test_data_location)
 
 
 def parse_test_urls(test_data_location) -> Optional[Union[str, List[str]]]:
@@ -405,7 +422,7 @@ def live_trapi_endpoint(url: str) -> Optional[Dict]:
     # to its '/meta_knowledge_graph' endpoint
     mkg_test_url: str = f"{url}/meta_knowledge_graph"
     try:
-        request = requests.get(mkg_test_url)
+        request = _http_session.get(mkg_test_url)
         if request.status_code == 200:
             # Success! given url is deemed a 'live' TRAPI endpoint
             # TODO: since we are accessing this endpoint now, perhaps we can
@@ -541,7 +558,7 @@ def validate_servers(
         if not (
                 'url' in server and
                 'x-maturity' in server and
-                server['x-maturity'] in DEPLOYMENT_TYPES
+                server['x-maturity'] in _DEPLOYMENT_TYPE_SET
         ):
             # sanity check!
             continue
@@ -806,6 +823,26 @@ def get_testable_resources_from_registry(
     return kp_ids, ara_ids
 
 
+@lru_cache(maxsize=64)
+def _parse_target_sources(target_sources: FrozenSet[str]) -> Tuple[FrozenSet[str], Tuple[Tuple[str, str], ...]]:
+    """
+    Sorts target source identifiers into exact identifiers and (prefix, suffix) wildcard patterns,
+    only once per distinct set of target sources (rather than once per Registry entry filtered).
+
+    :param target_sources: FrozenSet[str], of target identifiers or wildcard patterns of interest
+    :return: Tuple[FrozenSet[str], Tuple[Tuple[str, str], ...]], exact identifiers and (prefix, suffix) patterns
+    """
+    exact_sources: Set[str] = set()
+    wildcard_sources: List[Tuple[str, str]] = list()
+    for entry in target_sources:
+        if entry.find("*") >= 0:
+            prefix, suffix = entry.split(sep="*", maxsplit=1)
+            wildcard_sources.append((prefix, suffix))
+        else:
+            exact_sources.add(entry)
+    return frozenset(exact_sources), tuple(wildcard_sources)
+
+
 def source_of_interest(service: Dict, target_sources: Set[str]) -> Optional[str]:
     """
     Source filtering function, checking a source identifier against a set of identifiers.
@@ -830,21 +867,14 @@ def source_of_interest(service: Dict, target_sources: Set[str]) -> Optional[str]
         return None
 
     if target_sources:
-        found: bool = False
-        for entry in target_sources:
-
-            if entry.find("*") >= 0:
-                part = entry.split(sep="*", maxsplit=1)  # part should be a 2-tuple
-                if not part[0] or infores.startswith(part[0]):
-                    if not part[1] or infores.endswith(part[1]):
-                        found = True
-                        break
-
-            elif infores == entry:  # exact match?
-                found = True
-                break
-
-        if not found:
+        exact_sources, wildcard_sources = _parse_target_sources(frozenset(target_sources))
+        if not (
+            infores in exact_sources or  # exact match?
+            any(
+                (not prefix or infores.startswith(prefix)) and (not suffix or infores.endswith(suffix))
+                for prefix, suffix in wildcard_sources
+            )
+        ):
             return None
 
     # default if no target_sources or matching
@@ -857,6 +887,24 @@ def source_of_interest(service: Dict, target_sources: Set[str]) -> Optional[str]
 #           https://github.com/TranslatorSRI/SRI_testing/issues/59
 DEPLOYMENT_TYPES: List[str] = ['production', 'staging', 'testing', 'development']
 
+# the same deployment types, for (hashed) membership checks of Registry 'x-maturity' values
+_DEPLOYMENT_TYPE_SET: FrozenSet[str] = frozenset(DEPLOYMENT_TYPES)
+
+
+@lru_cache(maxsize=1024)
+def _parse_semver(version: str, major_minor: bool = False) -> SemVer:
+    """
+    Parses a SemVer version string, only once per distinct (version, major_minor) combination, since the same
+    few TRAPI (and Biolink Model) versions are compared again and again while filtering the Registry entries.
+
+    :param version: str, SemVer version string
+    :param major_minor: bool, if True, only parse the 'major' and 'minor' fields of the version (default: False)
+    :return: SemVer, parsed version
+    """
+    if major_minor:
+        return SemVer.from_string(version, core_fields=['major', 'minor'], ext_fields=[])
+    return SemVer.from_string(version)
+
 
 def assess_trapi_version(
         infores: str,
@@ -888,8 +936,7 @@ def assess_trapi_version(
         # 1. If the service TRAPI version of the service is an exact or compatible match
         #    to the major, minor level of the requested TRAPI version.
         #    (i.e. '1.4.1-beta' would be compatible to a '1.4.0' target), then select it.
-        if SemVer.from_string(target_version, core_fields=['major', 'minor'], ext_fields=[]) \
-                == SemVer.from_string(service_version, core_fields=['major', 'minor'], ext_fields=[]):
+        if _parse_semver(target_version, major_minor=True) == _parse_semver(service_version, major_minor=True):
             candidate_version = service_version
     else:
         # 2. If the 'trapi_version' argument IS NOT set (i.e. is 'None'),
@@ -898,7 +945,7 @@ def assess_trapi_version(
 
     if candidate_version is not None:
         if infores not in selected_service_trapi_version or \
-                SemVer.from_string(candidate_version) >= SemVer.from_string(selected_service_trapi_version[infores]):
+                _parse_semver(candidate_version) >= _parse_semver(selected_service_trapi_version[infores]):
             selected_service_trapi_version[infores] = candidate_version
 
 
@@ -964,8 +1011,13 @@ def extract_component_test_metadata_from_registry(
 
     for index, service in enumerate(registry_data['hits']):
 
+        # The 'info' and 'info.x-translator' blocks are looked up once per service
+        # here, for the several tag values read from them in this loop body
+        info: Dict = service.get("info") or dict()
+        x_translator: Dict = info.get("x-translator") or dict()
+
         # We are only interested in services belonging to a given category of components
-        component = tag_value(service, "info.x-translator.component")
+        component = x_translator.get("component")
         if not (component and component == target_component_type):
             continue
 
@@ -980,7 +1032,7 @@ def extract_component_test_metadata_from_registry(
             continue
 
         # Filter early for TRAPI version
-        service_trapi_version = tag_value(service, "info.x-trapi.version")
+        service_trapi_version = (info.get("x-trapi") or dict()).get("version")
         assess_trapi_version(infores, service_trapi_version, target_trapi_version, selected_service_trapi_version)
 
         # Current service doesn't have appropriate trapi_version, so skip the service
@@ -1010,12 +1062,12 @@ def extract_component_test_metadata_from_registry(
         # Now, we start to collect the remaining Registry metadata
 
         # Grab additional service metadata, then store it all
-        service_version = tag_value(service, "info.version")
-        biolink_version = tag_value(service, "info.x-translator.biolink-version")
+        service_version = info.get("version")
+        biolink_version = x_translator.get("biolink-version")
 
         # TODO: temporary hack to deal with resources which are somewhat sloppy or erroneous in their declaration
         #       of the applicable Biolink Model version for validation: enforce a minimium Biolink Model version.
-        if not biolink_version or SemVer.from_string(MINIMUM_BIOLINK_VERSION) >= SemVer.from_string(biolink_version):
+        if not biolink_version or _parse_semver(MINIMUM_BIOLINK_VERSION) >= _parse_semver(biolink_version):
             biolink_version = MINIMUM_BIOLINK_VERSION
 
         # Index services by (infores, trapi_version, biolink_version)
@@ -1073,11 +1125,17 @@ def extract_component_test_metadata_from_registry(
 # (do I need to periodically refresh it in long-running applications?)
 _the_registry_data: Optional[Dict] = None
 
+# Tracks whether the cached Registry Data was read from the 'mock' Registry,
+# so that it is re-read if mock_registry() later switches the Registry used
+_the_registry_data_is_mock: Optional[bool] = None
+
 
 def get_the_registry_data(refresh: bool = False) -> Dict:
-    global _the_registry_data
-    if not _the_registry_data or refresh:
+    global _the_registry_data, _the_registry_data_is_mock
+    is_mock: bool = is_mock_registry()
+    if not _the_registry_data or refresh or is_mock != _the_registry_data_is_mock:
         _the_registry_data = query_smart_api(parameters=SMARTAPI_QUERY_PARAMETERS)
+        _the_registry_data_is_mock = is_mock
     return _the_registry_data
 
 
@@ -1089,7 +1147,7 @@ def get_remote_test_data_file(url: str) -> Optional[Dict]:
     """
     data: Optional[Dict] = None
     try:
-        request = requests.get(f"{url}")
+        request = _http_session.get(f"{url}")
         if request.status_code == 200:
             data = request.json()
     except RequestException as re:
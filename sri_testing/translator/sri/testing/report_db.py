@@ -7,7 +7,6 @@ from time import sleep
 import shutil
 from datetime import datetime
 from urllib.parse import quote_plus
-from json import JSONEncoder, dump, dumps
 import orjson
 
 from pymongo import MongoClient
@@ -33,16 +32,29 @@ class TestReportDatabaseException(RuntimeError):
     pass
 
 
-class ReportJsonEncoder(JSONEncoder):
-    def default(self, o):
-        try:
-            iterable = iter(o)
-        except TypeError:
-            pass
-        else:
-            return list(iterable)
-        # Let the base class default method raise the TypeError
-        return JSONEncoder.default(self, o)
+def _report_json_default(o):
+    """
+    The orjson 'default' serializer of test report documents: any other iterable (e.g. a set) becomes a JSON list.
+    """
+    try:
+        iterable = iter(o)
+    except TypeError:
+        raise TypeError(f"Type '{type(o).__name__}' is not JSON serializable")
+    return list(iterable)
+
+
+def encode_report_json(document: Dict, indent: bool = False) -> bytes:
+    """
+    Encodes a test report document as (UTF-8 encoded) JSON, using the (much faster) orjson library.
+
+    :param document: Dict, Python object to encode as a JSON document.
+    :param indent: bool, if True, pretty print the JSON text (with an indentation of two spaces).
+    :return: bytes, UTF-8 encoded JSON document
+    """
+    option: int = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(document, default=_report_json_default, option=option)
 
 
 class TestReportDatabase:
@@ -306,8 +318,8 @@ class FileTestReport(TestReport):
         document_path = self.get_absolute_file_path(document_key=document_key, create_path=True)
         try:
             # TODO: maybe I need to write 'is_big' files out as binary?
-            with open(f"{document_path}.json", mode='xt', encoding='utf8', buffering=1, newline='\n') as document_file:
-                dump(obj=document, fp=document_file, cls=ReportJsonEncoder, indent=4)
+            with open(f"{document_path}.json", mode='xb') as document_file:
+                document_file.write(encode_report_json(document, indent=True))
                 document_file.flush()
             with open(f"{document_path}.json", mode='rt', encoding='utf8', buffering=1, newline='\n') as document_file:
                 pass
@@ -398,8 +410,8 @@ class FileReportDatabase(TestReportDatabase):
             time_created: str = datetime.now().strftime("%Y-%b-%d_%Hhr%M")
             document = {"time_created": time_created}
             try:
-                with open(creation_log_file, mode='w', encoding='utf8', buffering=1, newline='\n') as log_file:
-                    dump(obj=document, fp=log_file, indent=4)
+                with open(creation_log_file, mode='wb') as log_file:
+                    log_file.write(encode_report_json(document, indent=True))
             except OSError as ose:
                 logger.warning(f"'{creation_log_file}' cannot be written out: {str(ose)}?")
 
@@ -530,7 +542,7 @@ class MongoTestReport(TestReport):
 
         if is_big:
             # Save this large document with GridFS
-            gridfs_uid = self._gridfs.put(dumps(obj=document, cls=ReportJsonEncoder), encoding="utf8")
+            gridfs_uid = self._gridfs.put(encode_report_json(document))
             # we save large documents in GridFS dereferenced by a proxy document in the main database
             proxy_document = {
                 'document_key': document_key,
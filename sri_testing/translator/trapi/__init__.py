@@ -116,7 +116,7 @@ def generate_test_error_msg_prefix(case: Dict, test_name: str) -> str:
 
 
 def generate_edge_id(resource_id: str, edge_i: int) -> str:
-    return f"{resource_id}#{str(edge_i)}"
+    return f"{resource_id}#{edge_i}"
 
 
 def constrain_trapi_request_to_kp(trapi_request: Dict, kp_source: str) -> Dict:
@@ -1,11 +1,14 @@
 """
 Configure one hop tests
 """
-from typing import Optional, Union, List, Set, Dict, Any, Tuple
-from collections import defaultdict
+from typing import Optional, Union, List, Set, Dict, Any, Tuple, Callable
+from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor, Future
 from copy import deepcopy
+from functools import lru_cache
+from operator import itemgetter
 
-from pytest import UsageError
+from pytest import UsageError, StashKey
 from pytest_harvest import get_session_results_dct
 
 from reasoner_validator.biolink import BiolinkValidator
@@ -44,13 +47,12 @@ def _new_kp_test_case_summary(trapi_version: str, biolink_version: str) -> Dict[
 
     :return: Dict[str, Union[int, str, Dict]], initialized
     """
-    new_test_case_summary: Dict[str, Union[int, str, Dict]] = {
+    return {
         'no_of_edges': 0,
         'trapi_version': trapi_version,
         'biolink_version': biolink_version,
         'results': dict()
     }
-    return new_test_case_summary
 
 
 def _new_kp_resource_summary(
@@ -69,14 +71,13 @@ def _new_kp_resource_summary(
 
     :return: Dict[str, Union[int, str, Dict]], initialized
     """
-    kp_resource_summary: Dict[str, Union[str, Dict]] = {
+    return {
         'url': url,
         'x_maturity': x_maturity,
         'trapi_version': trapi_version,
         'biolink_version': biolink_version,
         'test_edges': dict()
     }
-    return kp_resource_summary
 
 
 def _new_kp_recommendation_summary(
@@ -95,17 +96,16 @@ def _new_kp_recommendation_summary(
 
     :return: Dict[str, Union[int, str, Dict]], initialized
     """
-    new_recommendations: Dict[str, Union[str, Dict]] = {
+    return {
         'url': url,
         'x_maturity': x_maturity,
         'trapi_version': trapi_version,
         'biolink_version': biolink_version,
-        'critical': dict(),
-        'errors': dict(),
-        'warnings': dict(),
-        'information': dict()
+        'critical': defaultdict(list),
+        'errors': defaultdict(list),
+        'warnings': defaultdict(list),
+        'information': defaultdict(list)
     }
-    return new_recommendations
 
 
 def _compile_recommendations(
@@ -136,19 +136,25 @@ def _compile_recommendations(
     #       ],
     # ...
     #    }
-    # TODO: what if test_case lacks some of the keys?
-    test_data: Dict = {
-        "subject_category": test_case["subject_category"],
-        "object_category": test_case["object_category"],
-        "predicate": test_case["predicate"],
-        "subject_id": test_case["subject_id"] if "subject_id" in test_case else test_case["subject"],
-        "object_id": test_case["object_id"] if "object_id" in test_case else test_case["object"]
-    }
-
-    if 'qualifiers' in test_case:
-        test_data['qualifiers'] = deepcopy(test_case['qualifiers'])
-    if 'association' in test_case:
-        test_data['association'] = test_case["association"]
+    # The test_data is only built once, if and when the first message is captured
+    test_data: Optional[Dict] = None
+
+    def _get_test_data() -> Dict:
+        nonlocal test_data
+        if test_data is None:
+            # TODO: what if test_case lacks some of the keys?
+            test_data = {
+                "subject_category": test_case["subject_category"],
+                "object_category": test_case["object_category"],
+                "predicate": test_case["predicate"],
+                "subject_id": test_case["subject_id"] if "subject_id" in test_case else test_case["subject"],
+                "object_id": test_case["object_id"] if "object_id" in test_case else test_case["object"]
+            }
+            if 'qualifiers' in test_case:
+                test_data['qualifiers'] = deepcopy(test_case['qualifiers'])
+            if 'association' in test_case:
+                test_data['association'] = test_case["association"]
+        return test_data
 
     # Validation messages are a dictionary with validation_code as keys and values which
     # are a (possibly empty) list of dictionaries with optional (variable key) parameters.
@@ -156,27 +162,27 @@ def _compile_recommendations(
     def _capture_messages(message_type: str, messages: MESSAGE_PARTITION):
         code: str  # message 'code' as indexing key
         scoped_messages: SCOPED_MESSAGES
+        # the message_type partitions are defaultdict(list), indexed by code;
+        # the scoped messages of the test report are referenced as is, never mutated
+        messages_by_code: Dict[str, List] = recommendation_summary[message_type]
         for code, scoped_messages in messages.items():
-            if code not in recommendation_summary[message_type]:
-                recommendation_summary[message_type][code] = list()
-            item: Dict = {
-                "message": scoped_messages,
-                "test_data": test_data,
-                "test": test_id
-            }
-            recommendation_summary[message_type][code].append(item)
-
-    if test_report.has_critical():
-        _capture_messages(message_type="critical", messages=test_report.get_critical())
-
-    if test_report.has_errors():
-        _capture_messages(message_type="errors", messages=test_report.get_errors())
-
-    if test_report.has_warnings():
-        _capture_messages(message_type="warnings", messages=test_report.get_warnings())
+            messages_by_code[code].append(
+                {
+                    "message": scoped_messages,
+                    "test_data": _get_test_data(),
+                    "test": test_id
+                }
+            )
 
-    if test_report.has_information():
-        _capture_messages(message_type="information", messages=test_report.get_info())
+    # an empty message partition simply has nothing to capture
+    for message_type, messages in (
+        ("critical", test_report.get_critical()),
+        ("errors", test_report.get_errors()),
+        ("warnings", test_report.get_warnings()),
+        ("information", test_report.get_info())
+    ):
+        if messages:
+            _capture_messages(message_type=message_type, messages=messages)
 
 
 def _new_unit_test_statistics() -> Dict[str, int]:
@@ -196,18 +202,25 @@ def _new_unit_test_statistics() -> Dict[str, int]:
     return new_stats
 
 
+# The unit tests are all registered once the onehop.util module is imported, so their
+# names may be cached here for sanity checking (their codes are already a frozenset)
+_UNIT_TEST_SET: frozenset = frozenset(get_unit_test_list())
+_UNIT_TEST_CODES: frozenset = get_unit_test_codes()
+
+_VALID_TEST_RESULTS: frozenset = frozenset(('passed', 'failed', 'skipped', 'warning', 'info'))
+
+
 def _tally_unit_test_result(test_case_summary: Dict, test_id: str, edge_num: int, test_result: str):
 
     # Sanity checks...
     assert 'results' in test_case_summary, "Missing results in summary?"
 
-    assert test_id in get_unit_test_list(), \
-        f"Invalid test_result '{str(test_result)}'"
-    assert test_result in ['passed', 'failed', 'skipped', 'warning', 'info'], \
+    assert test_id in _UNIT_TEST_SET, \
+        f"Invalid test_id '{str(test_id)}'"
+    assert test_result in _VALID_TEST_RESULTS, \
         f"Invalid test_result '{str(test_result)}'"
 
-    while edge_num + 1 > test_case_summary['no_of_edges']:
-        test_case_summary['no_of_edges'] += 1
+    test_case_summary['no_of_edges'] = max(test_case_summary['no_of_edges'], edge_num + 1)
 
     results = test_case_summary['results']
     if test_id not in results:
@@ -226,14 +239,32 @@ def _tally_unit_test_result(test_case_summary: Dict, test_id: str, edge_num: int
 # 5. Recommendations: KP (or ARA/KP) non-redundant hierarchical summary of validation messages
 ##########################################################################################
 
+# Maximum number of threads concurrently saving resource summaries and recommendations
+_MAX_SUMMARY_SAVE_WORKERS: int = 8
+
 # Selective list of Resource Summary fields
-RESOURCE_SUMMARY_FIELDS = [
+RESOURCE_SUMMARY_FIELDS: Tuple[str, ...] = (
     "subject_category",
     "object_category",
     "predicate",
     "subject_id",
     "object_id"
-]
+)
+_get_resource_summary_fields = itemgetter(*RESOURCE_SUMMARY_FIELDS)
+
+
+def _resource_summary_test_data(test_case: Dict) -> Dict[str, str]:
+    """
+    Extract the selected Resource Summary fields from a test case.
+
+    :param test_case: Dict, test case edge data
+    :return: Dict[str, str], values of the RESOURCE_SUMMARY_FIELDS found in the test case
+    """
+    try:
+        return dict(zip(RESOURCE_SUMMARY_FIELDS, _get_resource_summary_fields(test_case)))
+    except KeyError:
+        # some fields missing, so only take those available
+        return {field: test_case[field] for field in RESOURCE_SUMMARY_FIELDS if field in test_case}
 
 
 def pytest_sessionfinish(session):
@@ -251,29 +282,49 @@ def pytest_sessionfinish(session):
     session_results = get_session_results_dct(session)
 
     # tag test run summary with the scope of validation: 'full' or 'light'
-    test_run_summary: Dict = {
-        "mode": "FullComplianceValidation" if FULL_VALIDATION else "HopLite"
-    }
-    resource_summaries: Dict = dict()
-    recommendation_summaries: Dict = dict()
+    test_run_summary: Dict = defaultdict(dict)
+    test_run_summary["mode"] = "FullComplianceValidation" if FULL_VALIDATION else "HopLite"
+
+    # Resource and recommendation summaries are indexed in parallel
+    # by component, then (for ARAs) by ara_id, then by kp_id
+    resource_summaries: Dict = defaultdict(lambda: defaultdict(dict))
+    recommendation_summaries: Dict = defaultdict(lambda: defaultdict(dict))
+
+    # Edge details documents are only cached in RAM until all of their unit test
+    # results are recorded, so we first count the number of results expected for each edge
     case_details: Dict = dict()
 
+    # The (possibly huge) TRAPI I/O documents of failed unit tests are saved in a
+    # background thread, overlapping their I/O with the compilation of the test results
+    response_writer: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+    response_saves: List[Future] = list()
+
+    # each unit test name is only parsed once, cleaning it up for safe file system usage
+    unit_test_names: Dict[str, Tuple[str, str, str, int, str, str]] = {
+        unit_test_key: parse_unit_test_name(unit_test_key=unit_test_key) for unit_test_key in session_results
+    }
+    pending_case_results: Counter = Counter(
+        unit_test_name[-1] for unit_test_name in unit_test_names.values()
+    )
+
     for unit_test_key, details in session_results.items():
 
         rb: Dict = details['fixtures']['results_bag']
 
         # sanity check: clean up MS Windoze EOL characters, when present in results_bag keys
-        rb = {key.strip("\r\n"): value for key, value in rb.items()}
+        # (only rebuilding the results_bag in the rare case that such characters are seen)
+        if any('\r' in key or '\n' in key for key in rb):
+            rb = {key.strip("\r\n"): value for key, value in rb.items()}
 
         # Sanity check? Missing 'case' would
         # seem like an SRI Testing logical bug?
         assert 'case' in rb
         test_case = rb['case']
 
-        # clean up the name for safe file system usage
-        component, ara_id, kp_id, edge_num, test_id, edge_details_key = parse_unit_test_name(
-            unit_test_key=unit_test_key
-        )
+        component, ara_id, kp_id, edge_num, test_id, edge_details_key = unit_test_names[unit_test_key]
+
+        # 'PASSED, FAILED, SKIPPED' status of the unit test
+        status: str = details['status']
 
         # Sanity check: missing 'url' or 'x_maturity' is likely a logical bug in SRI Testing?
         assert 'url' in test_case
@@ -293,29 +344,19 @@ def pytest_sessionfinish(session):
         ##############################################################
         # Summary file indexed by component, resources and edge cases
         ##############################################################
-        if component not in test_run_summary:
-            test_run_summary[component] = dict()
-
-            # Set up indexed resource summaries ...
-            resource_summaries[component] = dict()
-
-            # ... and recommendation summaries in parallel
-            recommendation_summaries[component] = dict()
-
         case_summary: Dict
         if ara_id:
-            if ara_id not in test_run_summary[component]:
-                test_run_summary[component][ara_id] = dict()
-                test_run_summary[component][ara_id]['url'] = url
-                test_run_summary[component][ara_id]['x_maturity'] = x_maturity
-                test_run_summary[component][ara_id]['test_data_location'] = test_case['ara_test_config_location']
-                test_run_summary[component][ara_id]['kps'] = dict()
-
-                resource_summaries[component][ara_id] = dict()
-                recommendation_summaries[component][ara_id] = dict()
-
-            if kp_id not in test_run_summary[component][ara_id]['kps']:
-                test_run_summary[component][ara_id]['kps'][kp_id] = _new_kp_test_case_summary(
+            ara_summary: Optional[Dict] = test_run_summary[component].get(ara_id)
+            if ara_summary is None:
+                ara_summary = test_run_summary[component][ara_id] = {
+                    'url': url,
+                    'x_maturity': x_maturity,
+                    'test_data_location': test_case['ara_test_config_location'],
+                    'kps': dict()
+                }
+
+            if kp_id not in ara_summary['kps']:
+                ara_summary['kps'][kp_id] = _new_kp_test_case_summary(
                     trapi_version=trapi_version,
                     biolink_version=biolink_version
                 )
@@ -332,20 +373,22 @@ def pytest_sessionfinish(session):
                     biolink_version=biolink_version
                 )
 
-            case_summary = test_run_summary[component][ara_id]['kps'][kp_id]
+            case_summary = ara_summary['kps'][kp_id]
             resource_summary = resource_summaries[component][ara_id][kp_id]
             recommendation_summary = recommendation_summaries[component][ara_id][kp_id]
 
         else:
-            if kp_id not in test_run_summary[component]:
-                test_run_summary[component][kp_id] = _new_kp_test_case_summary(
-                    trapi_version=trapi_version,
-                    biolink_version=biolink_version
-                )
-                test_run_summary[component][kp_id]['url'] = url
-                test_run_summary[component][kp_id]['x_maturity'] = x_maturity
-                test_run_summary[component][kp_id]['test_data_location'] = test_case['ks_test_data_location']
-
+            case_summary = test_run_summary[component].get(kp_id)
+            if case_summary is None:
+                case_summary = test_run_summary[component][kp_id] = {
+                    **_new_kp_test_case_summary(
+                        trapi_version=trapi_version,
+                        biolink_version=biolink_version
+                    ),
+                    'url': url,
+                    'x_maturity': x_maturity,
+                    'test_data_location': test_case['ks_test_data_location']
+                }
                 resource_summaries[component][kp_id] = _new_kp_resource_summary(
                     url=url,
                     x_maturity=x_maturity,
@@ -359,34 +402,28 @@ def pytest_sessionfinish(session):
                     biolink_version=biolink_version
                 )
 
-            case_summary = test_run_summary[component][kp_id]
             resource_summary = resource_summaries[component][kp_id]
             recommendation_summary = recommendation_summaries[component][kp_id]
 
         # Tally up the number of test results of a given 'status' across 'test_id' unit test categories
-        _tally_unit_test_result(case_summary, test_id, edge_num, details['status'])
+        _tally_unit_test_result(case_summary, test_id, edge_num, status)
 
         # TODO: merge case details here into a Cartesian product table of edges
         #       and unit test id's for a given resource indexed by ARA and KP
         idx: str = str(test_case['idx'])
 
+        # the test data of a given edge is the same for all its unit tests, hence only captured on first visit
         if idx not in resource_summary['test_edges']:
             resource_summary['test_edges'][idx] = {
-                'test_data': dict(),
-                'results': dict()
+                'test_data': _resource_summary_test_data(test_case),
+                'results': defaultdict(dict)
             }
-
-        for field in RESOURCE_SUMMARY_FIELDS:
-            if field not in resource_summary['test_edges'][idx]['test_data'] and field in test_case:
-                resource_summary['test_edges'][idx]['test_data'][field] = test_case[field]
-
-        if test_id not in resource_summary['test_edges'][idx]['results']:
-            resource_summary['test_edges'][idx]['results'][test_id] = dict()
-        resource_summary['test_edges'][idx]['results'][test_id]['outcome'] = details['status']
+        test_edge_result: Dict = resource_summary['test_edges'][idx]['results'][test_id]
+        test_edge_result['outcome'] = status
 
         test_report: UnitTestReport = rb['unit_test_report']
         if test_report and test_report.has_messages():
-            resource_summary['test_edges'][idx]['results'][test_id]['validation'] = test_report.get_messages()
+            test_edge_result['validation'] = test_report.get_messages()
 
             # Capture recommendations
             _compile_recommendations(recommendation_summary, test_report, test_case, test_id)
@@ -396,27 +433,22 @@ def pytest_sessionfinish(session):
         ###################################################
         if edge_details_key not in case_details:
 
-            # TODO: this is a bit memory intensive... may need a
-            #       better strategy for saving some of the details?
             case_details[edge_details_key] = dict()
 
             if 'case' in rb and 'case' not in case_details[edge_details_key]:
                 case_details[edge_details_key] = test_case
 
             if 'results' not in case_details[edge_details_key]:
-                case_details[edge_details_key]['results'] = dict()
-
-        if test_id not in case_details[edge_details_key]['results']:
-            case_details[edge_details_key]['results'][test_id] = dict()
+                case_details[edge_details_key]['results'] = defaultdict(dict)
 
         test_details = case_details[edge_details_key]['results'][test_id]
 
         # Replicating 'PASSED, FAILED, SKIPPED' test status
         # for each unit test, here in the detailed report
-        test_details['outcome'] = details['status']
+        test_details['outcome'] = status
 
         # Capture more request details for tests that are run (not skipped)
-        if details['status'] != 'skipped':
+        if status != 'skipped':
 
             if 'request' in rb:
                 # TODO: maybe the 'request' document could be persisted
@@ -426,107 +458,71 @@ def pytest_sessionfinish(session):
                 test_details['request'] = "No 'request' generated for this unit test?"
 
         # Capture more response details for test failures
-        if details['status'] == 'failed':
+        if status == 'failed':
             if 'response' in rb:
                 case_response: Dict = dict()
-                case_response['url'] = test_case['url'] if 'url' in test_case else "Unknown?!"
-                case_response['x_maturity'] = test_case['x_maturity'] if 'x_maturity' in test_case else "Unknown?!"
+                case_response['url'] = url
+                case_response['x_maturity'] = x_maturity
                 case_response['unit_test_key'] = unit_test_key
                 case_response['http_status_code'] = rb["response"]["status_code"]
                 case_response['response'] = rb['response']['response_json']
 
                 response_document_key = f"{edge_details_key}-{test_id}"
-                test_run.save_json_document(
-                    document_type="TRAPI I/O",
-                    document=case_response,
-                    document_key=response_document_key,
-                    index=[],
-                    is_big=True
+                response_saves.append(
+                    response_writer.submit(
+                        test_run.save_json_document,
+                        document_type="TRAPI I/O",
+                        document=case_response,
+                        document_key=response_document_key,
+                        index=[],
+                        is_big=True
+                    )
                 )
 
             else:
                 test_details['response'] = "No 'response' generated for this unit test?"
 
-        # TODO: in principle, with a database, we could now simply update
-        #       the 'test_details' document here, updated with the
-        #       just encountered test result, rather than cache it in RAM
-        #       then defer writing it out later below, once it is complete?
-
-    # TODO: it would be nice to avoid compiling the case_details dictionary in RAM, for later saving,
-    #       but this currently seems *almost* unavoidable, for the aggregated details file document?
-    #       By "almost", one means that a document already written out could be read back into memory
-    #       then updated, but if one is doing this, why not rather use a (document) database?
-    #
-    # Save the cached details of each edge test case
-    for edge_details_key in case_details:
-        test_run.save_json_document(
-            document_type="Details",
-            document=case_details[edge_details_key],
-            document_key=edge_details_key,
-            index=[]
-        )
-
-    # TODO: could the following resource test summaries and recommendations code be refactored to be more DRY?
-    #
-    # Save the various resource test summaries
-    #
-    # All KP's individually
-    if "KP" in resource_summaries:
-        kp_summaries = resource_summaries["KP"]
-        for kp in kp_summaries:
-            # Save Test Run Summary
-            document_key: str = f"KP/{kp}/resource_summary"
+        # Save the details of the edge test case, once all of its unit test results are recorded
+        pending_case_results[edge_details_key] -= 1
+        if not pending_case_results[edge_details_key]:
             test_run.save_json_document(
-                document_type="Direct KP Summary",
-                document=kp_summaries[kp],
-                document_key=document_key,
+                document_type="Details",
+                document=case_details.pop(edge_details_key),
+                document_key=edge_details_key,
                 index=[]
             )
 
-    # All KP's called by ARA's
-    if "ARA" in resource_summaries:
-        ara_summaries = resource_summaries["ARA"]
-        for ara in ara_summaries:
-            for kp in ara_summaries[ara]:
-                # Save Test Run embedded KP Resource Summary
-                document_key: str = f"ARA/{ara}/{kp}/resource_summary"
-                test_run.save_json_document(
-                    document_type="ARA Embedded KP Summary",
-                    document=ara_summaries[ara][kp],
-                    document_key=document_key,
-                    index=[]
-                )
-    #
-    # Save the various recommendation summaries
-    #
-    # All KP's individually
-    if "KP" in recommendation_summaries:
-        kp_summaries = recommendation_summaries["KP"]
-        for kp in kp_summaries:
-            # Save Test Run Recommendations
-            document_key: str = f"KP/{kp}/recommendations"
-            test_run.save_json_document(
-                document_type="Direct KP Recommendations",
-                document=kp_summaries[kp],
-                document_key=document_key,
-                index=[]
+    # Wait for the TRAPI I/O documents to be completely saved, raising any exception seen while saving them
+    response_writer.shutdown(wait=True)
+    for response_save in response_saves:
+        response_save.result()
+
+    # Gather the various resource test summaries and recommendations, for saving: all KP's
+    # individually, then all KP's called by ARA's, respectively indexed by document suffix
+    summary_documents: List[Tuple[str, Dict, str]] = list()
+    for summaries, suffix, kp_document_type, ara_document_type in (
+            (resource_summaries, "resource_summary", "Direct KP Summary", "ARA Embedded KP Summary"),
+            (
+                recommendation_summaries, "recommendations",
+                "Direct KP Recommendations", "ARA Embedded KP Recommendations"
             )
-
-    # All KP's called by ARA's
-    if "ARA" in recommendation_summaries:
-        ara_summaries = recommendation_summaries["ARA"]
-        for ara in ara_summaries:
-            for kp in ara_summaries[ara]:
-                # Save Test Run embedded KP Resource Recommendations
-                document_key: str = f"ARA/{ara}/{kp}/recommendations"
-                test_run.save_json_document(
-                    document_type="ARA Embedded KP Recommendations",
-                    document=ara_summaries[ara][kp],
-                    document_key=document_key,
-                    index=[]
-                )
-
-    # Save Test Run Summary
+    ):
+        for kp, kp_summary in summaries.get("KP", {}).items():
+            summary_documents.append((kp_document_type, kp_summary, f"KP/{kp}/{suffix}"))
+        for ara, ara_kp_summaries in summaries.get("ARA", {}).items():
+            for kp, kp_summary in ara_kp_summaries.items():
+                summary_documents.append((ara_document_type, kp_summary, f"ARA/{ara}/{kp}/{suffix}"))
+
+    # The summary documents are independent of one another, so their
+    # (I/O bound) JSON serialization and saving is overlapped in a thread pool
+    def _save_summary(summary: Tuple[str, Dict, str]):
+        test_run.save_json_document(document_type=summary[0], document=summary[1], document_key=summary[2], index=[])
+
+    with ThreadPoolExecutor(max_workers=_MAX_SUMMARY_SAVE_WORKERS) as executor:
+        # consuming the map() results propagates any exception raised while saving
+        list(executor.map(_save_summary, summary_documents))
+
+    # The Test Run Summary is only saved after all the other documents are completely saved
     test_run.save_json_document(
         document_type="Test Run Summary",
         document=test_run_summary,
@@ -594,16 +590,6 @@ def pytest_addoption(parser):
     parser.addoption("--one", action="store_true", help="Only use first edge from each KP file")
 
 
-def _fix_path(file_path: str) -> str:
-    """
-    Fixes OS specific path string issues (especially, for MS Windows)
-    
-    :param file_path: file path to be repaired
-    """
-    file_path = file_path.replace("\\", "/")
-    return file_path
-
-
 def get_test_data_sources(
         component_type: str,
         source: Optional[str] = None,
@@ -657,6 +643,24 @@ def get_test_data_sources(
     return service_metadata
 
 
+# Key is the URL of a component test data file
+# Value is the raw (unannotated) file content, retrieved only once per Pytest session
+_remote_test_data_files: Dict[str, Optional[Dict]] = dict()
+
+
+def _get_test_data_file(test_data_url: str) -> Optional[Dict]:
+    """
+    Retrieves a component test data file, once per Pytest session.
+
+    :param test_data_url: str, URL of the test data file
+    :return: Optional[Dict], a private copy of the test data file content, which the caller may annotate
+    """
+    if test_data_url not in _remote_test_data_files:
+        _remote_test_data_files[test_data_url] = get_remote_test_data_file(test_data_url)
+    # distinct component releases may share a test data file, but each annotates its own copy of it
+    return deepcopy(_remote_test_data_files[test_data_url])
+
+
 def load_test_data_sources(
         registry_metadata: Dict[str, Any],
         source_id: Optional[str] = None
@@ -665,7 +669,8 @@ def load_test_data_sources(
     Load JSON metadata file(s) from a specified component test data source. Note that with the latest
     Translator SmartAPI Registry data model for info.x-trapi.test_data_location properties, that the
     actual data loaded may relate to several distinct x-maturity environments that may have more than
-    one JSON test file sources.
+    one JSON test file sources. Each test data file is only retrieved once per Pytest session, since
+    pytest_generate_tests() - which loads it - is called once for every test function.
 
     :param registry_metadata: Dict[str, Any], metadata associated with source
     :param source_id: str, reference id of the infores CURIE of the source component owning the registry metadata
@@ -673,13 +678,14 @@ def load_test_data_sources(
     """
     # sanity check
     assert registry_metadata is not None
+
     if 'sources' not in registry_metadata:
         registry_metadata['sources'] = dict()
 
     test_data_locations: List[str] = registry_metadata['test_data_location']
     for test_data_url in test_data_locations:
 
-        test_data = get_remote_test_data_file(test_data_url)
+        test_data = _get_test_data_file(test_data_url)
 
         if not test_data:
             logger.warning(f"Test Data source '{test_data_url}' has no test data?")
@@ -738,6 +744,8 @@ def get_ara_metadata(metafunc, trapi_version, biolink_version) -> Dict[str, Dict
     )
 
 
+# The same release identifiers are parsed by each pytest_generate_tests() call
+@lru_cache(maxsize=1024)
 def id_parts(identifier: str) -> Optional[Tuple[str, str, str, str]]:
     parts = identifier.split(',')
     if len(parts) != 4:
@@ -790,37 +798,98 @@ def get_kp_metadata(
                     f"get_kp_metadata(): '{ara_release}' has no valid test_data_location information?")
                 continue
 
+            # Although in principle, ARA's can have multiple test configuration files, this will
+            # likely be rare,  but nonetheless, we need to gather the KPs of all of them
+            ara_kps: Set[str] = set()
+            for test_config in arajson['sources'].values():
+                ara_kps.update(test_config['KPs'])
+
             # Blissful assumption here is that our kp_metadata
             # entries will all have infores CURIE references
-            kept: Dict = dict()
+            kept: Dict = {
+                kp_release: kp_release_metadata
+                for kp_release, kp_release_metadata in kp_metadata.items()
+                if 'infores' in kp_release_metadata and f"infores:{kp_release_metadata['infores']}" in ara_kps
+            }
 
-            # Although in principle, ARA's can have multiple test configuration files, this will
-            # likely be rare,  but nonetheless, we need to iterate as if it is the case
-            sources = arajson['sources']
-            for infores, test_config in sources.items():
+            kp_metadata = kept
 
-                kps: Set[str] = {kp_id for kp_id in test_config['KPs']}
+    return kp_metadata
 
-                for kp_source, kp_metadata in kp_metadata.items():
-                    if 'infores' in kp_metadata and f"infores:{kp_metadata['infores']}" in kps:
-                        kept[kp_source] = kp_metadata
 
-            kp_metadata = kept
+# Session-level cache of the (ARA, KP) test metadata, shared by all pytest_generate_tests() calls
+_test_metadata_key = StashKey[Tuple[Dict, Dict]]()
 
-    return kp_metadata
+
+def get_test_metadata(
+        metafunc,
+        trapi_version: Optional[str],
+        biolink_version: Optional[str]
+) -> Tuple[Dict[str, Dict[str, Optional[Union[str, Dict]]]], Dict[str, Dict[str, Optional[Union[str, Dict]]]]]:
+    """
+    Retrieves the ARA and KP test metadata, only resolved once per Pytest session, since
+    test parametrization is (re-)generated for each test function but the CLI options don't change.
+
+    :param metafunc: Dict, diverse One Step Pytest metadata
+    :param trapi_version: Optional[str], SemVer caller override of TRAPI release target for validation
+    :param biolink_version: Optional[str], SemVer caller override of Biolink Model release target for validation
+    :return: 2-Tuple(ara_metadata, kp_metadata) of service metadata dictionaries
+    """
+    stash = metafunc.config.stash
+    if _test_metadata_key not in stash:
+        ara_metadata = get_ara_metadata(metafunc, trapi_version, biolink_version)
+        kp_metadata = get_kp_metadata(metafunc, ara_metadata, trapi_version, biolink_version)
+        stash[_test_metadata_key] = ara_metadata, kp_metadata
+    return stash[_test_metadata_key]
+
+
+# Unit test ('trapi_creator') functions of each composite '--teststyle' option value;
+# any other '--teststyle' value is simply the name of a single unit test function
+_TESTSTYLE_CREATORS: Dict[str, Tuple[Callable, ...]] = {
+    'all': (
+        oh_util.by_subject,
+        oh_util.inverse_by_new_subject,
+        oh_util.by_object,
+        oh_util.raise_subject_entity,
+        oh_util.raise_object_entity,
+        oh_util.raise_object_by_subject,
+        oh_util.raise_predicate_by_subject
+    )
+}
 
 
-def generate_trapi_kp_tests(metafunc, kp_metadata) -> List:
+def generate_trapi_kp_tests(metafunc, kp_metadata) -> Tuple[List[Dict], Dict[str, List[Dict]]]:
     """
     Generate set of TRAPI Knowledge Provider unit tests with test data edges.
 
     :param metafunc: Dict, diverse One Step Pytest metadata
     :param kp_metadata, Dict[str, Dict[str, Optional[Union[str, Dict]]]], test edge data for one or more KPs
+    :return: 2-Tuple(edges, kp_source_edges) of the list of all KP test edges, plus
+             the same edges grouped (in their original order) by their 'kp_source' infores
     """
     edges: List = []
-    idlist: List = []
 
+    # Pytest identifiers of the KP test edges, built in step with the edges
+    idlist: List[str] = []
+
+    # We connect ARA's to their KPs by infores (== kp_source),
+    # hence the KP edges are also grouped here by their kp_source
+    kp_source_edges: Dict[str, List[Dict]] = defaultdict(list)
+
+    # The number of test edges taken from each test data source, 'None' being unlimited:
+    # '--one' only takes the first edge, otherwise a circuit breaker for overly large edge
+    # test data sets takes (one more than) a positive '--max_number_of_edges' value
     max_number_of_edges: int = int(metafunc.config.getoption('max_number_of_edges', default=100))
+    edges_limit: Optional[int]
+    if metafunc.config.getoption('one', default=False):
+        edges_limit = 1
+    elif max_number_of_edges > 0:
+        edges_limit = max_number_of_edges + 1
+    else:
+        edges_limit = None
+
+    # Test input edge echoing to stdout is only done for verbose ('-v') Pytest runs
+    verbose: bool = metafunc.config.getoption('verbose', default=0) > 0
 
     for kp_release, metadata in kp_metadata.items():
 
@@ -845,21 +914,41 @@ def generate_trapi_kp_tests(metafunc, kp_metadata) -> List:
             continue
 
         # TODO: see below about echoing the edge input data to the Pytest stdout
-        print(f"### Start of Test Input Edges for KP '{kp_id}' ###")
+        if verbose:
+            print(f"### Start of Test Input Edges for KP '{kp_id}' ###")
+
+        # The infores CURIEs are only built once, then shared by all the edges of the KP or source
+        kp_infores: str = f"infores:{kp_id}"
+
+        # KP level values of all of its test edges
+        kp_url: str = kpjson['url']
+        kp_x_maturity: str = kpjson['x_maturity']
+        kp_trapi_version: str = kpjson['trapi_version']
+        kp_biolink_version: str = kpjson['biolink_version']
 
         sources: Dict = kpjson['sources']
         for infores, test_data in sources.items():
 
-            dataset_level_test_exclusions: Set = set()
-            if "exclude_tests" in test_data:
-                dataset_level_test_exclusions.update(
-                    [test for test in test_data["exclude_tests"] if test in get_unit_test_codes()]
-                )
+            kp_source: str = f"infores:{infores}"
+
+            test_data_location: str = test_data['location']
+
+            # If not specified, we assume that the test data target
+            # Knowledge Source is a "primary_knowledge_source"
+            kp_source_type: str = test_data.get('source_type', "primary")
+
+            # only the known unit test codes are excluded
+            dataset_level_test_exclusions: frozenset = _UNIT_TEST_CODES.intersection(test_data.get("exclude_tests", ()))
 
             if 'edges' not in test_data:
                 logger.warning(f"Test Data for from '{infores}' has no edges? Weird... skipping!")
                 continue
 
+            # The loaded test data is held in the session's test metadata, so the untested
+            # edges beyond the limit are released here, rather than held in memory
+            if edges_limit is not None and len(test_data['edges']) > edges_limit:
+                test_data['edges'] = test_data['edges'][:edges_limit]
+
             for edge_i, edge in enumerate(test_data['edges']):
 
                 # We tag each edge internally with its
@@ -869,59 +958,43 @@ def generate_trapi_kp_tests(metafunc, kp_metadata) -> List:
                 # top level KP associated with the test data
                 # may be distinct from the underlying
                 # knowledge source being targeted by the test data
-                edge['kp_id'] = f"infores:{kp_id}"
+                edge['kp_id'] = kp_infores
 
                 # We can already do some basic Biolink Model validation here of the
                 # S-P-O contents of the edge being input from the current triples file?
-                biolink_validator: BiolinkValidator = BiolinkValidator(biolink_version=kpjson['biolink_version'])
-                biolink_validator.check_biolink_model_compliance_of_input_edge(edge)
-                if biolink_validator.has_messages():
-                    # defer reporting of errors to higher level of test harness
-                    edge['pre-validation'] = biolink_validator.get_messages()
-
-                edge['ks_test_data_location'] = test_data['location']
+                # (unless the caller has suppressed Biolink Model validation altogether)
+                if kp_biolink_version != "suppress":
+                    biolink_validator: BiolinkValidator = BiolinkValidator(biolink_version=kp_biolink_version)
+                    biolink_validator.check_biolink_model_compliance_of_input_edge(edge)
+                    if biolink_validator.has_messages():
+                        # defer reporting of errors to higher level of test harness
+                        edge['pre-validation'] = biolink_validator.get_messages()
 
-                edge['url'] = kpjson['url']
-                edge['x_maturity'] = kpjson['x_maturity']
+                edge['ks_test_data_location'] = test_data_location
 
-                edge['trapi_version'] = kpjson['trapi_version']
-                edge['biolink_version'] = kpjson['biolink_version']
+                edge['url'] = kp_url
+                edge['x_maturity'] = kp_x_maturity
 
-                edge['kp_source'] = f"infores:{infores}"
+                edge['trapi_version'] = kp_trapi_version
+                edge['biolink_version'] = kp_biolink_version
 
-                if 'source_type' in test_data:
-                    edge['kp_source_type'] = test_data['source_type']
-                else:
-                    # If not specified, we assume that the test data target
-                    # Knowledge Source is a "primary_knowledge_source"
-                    edge['kp_source_type'] = "primary"
+                edge['kp_source'] = kp_source
+                edge['kp_source_type'] = kp_source_type
 
+                # the edge exclude_tests are kept as a List, for JSON serialization safety later;
+                # they only need to be rebuilt when merged with any dataset level test exclusions
                 if dataset_level_test_exclusions:
-                    if 'exclude_tests' not in edge:
-                        edge['exclude_tests']: Set = dataset_level_test_exclusions
-                    else:
-                        # converting List internally to a set
-                        edge['exclude_tests'] = set(edge['exclude_tests'])
-                        edge['exclude_tests'].update(dataset_level_test_exclusions)
-
-                # convert back to List for JSON serialization safety later
-                if 'exclude_tests' in edge:
+                    edge['exclude_tests'] = list(dataset_level_test_exclusions.union(edge.get('exclude_tests', ())))
+                elif 'exclude_tests' in edge and not isinstance(edge['exclude_tests'], list):
                     edge['exclude_tests'] = list(edge['exclude_tests'])
 
                 edges.append(edge)
+                kp_source_edges[kp_source].append(edge)
 
-                edge_id = generate_edge_id(kp_id, edge_i)
-                idlist.append(edge_id)
-
-                if metafunc.config.getoption('one', default=False):
-                    # functionally identical to max_number_of_edges == 1
-                    break
+                idlist.append(generate_edge_id(kp_id, edge_i))
 
-                # Circuit breaker for overly large edge test data sets
-                if edge_i >= max_number_of_edges > 0:
-                    break
-
-        print(f"### End of Test Input Edges for KP '{kp_id}' ###")
+        if verbose:
+            print(f"### End of Test Input Edges for KP '{kp_id}' ###")
 
     if "kp_trapi_case" in metafunc.fixturenames:
 
@@ -932,40 +1005,31 @@ def generate_trapi_kp_tests(metafunc, kp_metadata) -> List:
         # Runtime specified (CLI) constraints on test scope,
         # which will be overridden by file set and specific
         # test triple-level exclude_tests scoping, as captured above
-        if teststyle == 'all':
-            global_test_inclusions = [
-                    oh_util.by_subject,
-                    oh_util.inverse_by_new_subject,
-                    oh_util.by_object,
-                    oh_util.raise_subject_entity,
-                    oh_util.raise_object_entity,
-                    oh_util.raise_object_by_subject,
-                    oh_util.raise_predicate_by_subject
-            ]
-        else:
-            global_test_inclusions = [getattr(oh_util, teststyle)]
+        global_test_inclusions = _TESTSTYLE_CREATORS.get(teststyle) or (getattr(oh_util, teststyle),)
 
         metafunc.parametrize("trapi_creator", global_test_inclusions)
 
-    return edges
+    return edges, kp_source_edges
 
 
 # Once the smartapi tests are up, we'll want to pass them in here as well
-def generate_trapi_ara_tests(metafunc, kp_edges, ara_metadata):
+def generate_trapi_ara_tests(metafunc, kp_source_edges: Dict[str, List[Dict]], ara_metadata):
     """
     Generate set of TRAPI Autonomous Relay Agents (ARA) unit tests with KP test data edges.
 
     :param metafunc: Dict, diverse One Step Pytest metadata
-    :param kp_edges: List, list of knowledge provider test edges from knowledge providers associated
+    :param kp_source_edges: Dict[str, List[Dict]], knowledge provider test edges, grouped by 'kp_source' infores
     :param ara_metadata, Dict[str, Dict[str, Optional[str]]], test run configuration for one or more ARAs
     """
-    kp_dict = defaultdict(list)
-    for e in kp_edges:
-        # We connect ARA's to their KPs by infores (== kp_source) now...
-        kp_dict[e['kp_source']].append(e)
-
     ara_edges = []
-    idlist = []
+
+    # Pytest identifiers of the ARA test edges, built in step with the edges
+    idlist: List[str] = []
+
+    # The Biolink Model validation of a KP test edge only depends on the edge S-P-O
+    # content and the Biolink Model version, so is only repeated here (once) for each
+    # distinct ARA Biolink Model version, indexed by the version and the KP edge identity
+    biolink_pre_validations: Dict[Tuple[str, int], Optional[Dict]] = dict()
 
     for ara_release, metadata in ara_metadata.items():
 
@@ -982,60 +1046,64 @@ def generate_trapi_ara_tests(metafunc, kp_edges, ara_metadata):
         sources = arajson['sources']
         for infores, test_config in sources.items():
 
+            # The ARA level values, overriding those of the KP test edges, only
+            # need to be set up once for each ARA test configuration source. Note that
+            # we override the KP TRAPI and Biolink Model versions with the ARA values here!
+            ara_overrides: Dict[str, str] = {
+                'ara_id': f"infores:{ara_id}",
+                'url': arajson['url'],
+                'x_maturity': arajson['x_maturity'],
+                'ara_test_config_location': test_config['location'],
+                'trapi_version': arajson['trapi_version'],
+                'biolink_version': arajson['biolink_version'],
+                'ara_source': f"infores:{infores}"
+            }
+
             for kp in test_config['KPs']:
 
-                if kp not in kp_dict:
+                kp_edges: Optional[List[Dict]] = kp_source_edges.get(kp)
+                if not kp_edges:
                     logger.warning(
                         f"generate_trapi_ara_tests(): '{kp}' test edges not (yet)" +
                         f" available for this source '{infores}' in ARA {ara_release}. Skipping..."
                     )
                     continue
 
-                for edge_i, kp_edge in enumerate(kp_dict[kp]):
+                # the 'kp_source' of all of these edges is the KP; their
+                # identifiers are numbered in sequence for each KP of the test configuration
+                resource_id: str = f"{ara_id}|{kp.replace('infores:', '')}"
 
-                    edge: dict = kp_edge.copy()
+                for edge_i, kp_edge in enumerate(kp_edges):
 
-                    edge['ara_id'] = f"infores:{ara_id}"
-
-                    edge['url'] = arajson['url']
-                    edge['x_maturity'] = arajson['x_maturity']
-                    edge['ara_test_config_location'] = test_config['location']
-
-                    # We override the KP TRAPI and Biolink Model versions with the ARA values here!
-
-                    edge['trapi_version'] = arajson['trapi_version']
-                    edge['biolink_version'] = arajson['biolink_version']
+                    edge: dict = {**kp_edge, **ara_overrides}
 
                     # Resetting the Biolink Model version here may have the peculiar side effect of some
                     # KP edge test data now becoming non-compliant with the 'new' ARA Biolink Model version?
-                    biolink_validator: BiolinkValidator = BiolinkValidator(biolink_version=arajson['biolink_version'])
-                    biolink_validator.check_biolink_model_compliance_of_input_edge(edge)
-                    if biolink_validator.has_messages():
-                        # defer reporting of errors to higher level of test harness
-                        edge['pre-validation'] = biolink_validator.get_messages()
-
-                    edge['ara_source'] = f"infores:{infores}"
-
-                    if 'kp_source' in kp_edge:
-                        edge['kp_source'] = kp_edge['kp_source']
-                    else:
+                    # (the KP edge 'pre-validation' is already applicable if the version is unchanged,
+                    #  and there is nothing to revalidate if the caller suppressed Biolink Model validation)
+                    if kp_edge['biolink_version'] != arajson['biolink_version'] != "suppress":
+                        pre_validation_key: Tuple[str, int] = (arajson['biolink_version'], id(kp_edge))
+                        if pre_validation_key not in biolink_pre_validations:
+                            biolink_validator: BiolinkValidator = \
+                                BiolinkValidator(biolink_version=arajson['biolink_version'])
+                            biolink_validator.check_biolink_model_compliance_of_input_edge(kp_edge)
+                            biolink_pre_validations[pre_validation_key] = \
+                                biolink_validator.get_messages() if biolink_validator.has_messages() else None
+                        if biolink_pre_validations[pre_validation_key]:
+                            # defer reporting of errors to higher level of test harness
+                            edge['pre-validation'] = biolink_pre_validations[pre_validation_key]
+
+                    if 'kp_source' not in kp_edge:
                         logger.warning(
                             f"generate_trapi_ara_tests(): KP '{kp}' edge is missing its 'kp_source' infores." +
                             "Inferred from KP name, but KP provenance may not be properly tested?"
                         )
                         edge['kp_source'] = kp
 
-                    edge['kp_source_type'] = kp_edge['kp_source_type']
-
-                    kp_id = edge['kp_source'].replace("infores:", "")
-
-                    resource_id = f"{ara_id}|{kp_id}"
-
-                    edge_id = generate_edge_id(resource_id, edge_i)
-                    idlist.append(edge_id)
-
                     ara_edges.append(edge)
 
+                    idlist.append(generate_edge_id(resource_id, edge_i))
+
     metafunc.parametrize('ara_trapi_case', ara_edges, ids=idlist)
 
 
@@ -1060,10 +1128,9 @@ def pytest_generate_tests(metafunc):
 
     # Note: the ARA and KP trapi_version and biolink_version values
     #       may be overridden here by the CLI caller values
-    ara_metadata = get_ara_metadata(metafunc, trapi_version, biolink_version)
-    kp_metadata = get_kp_metadata(metafunc, ara_metadata, trapi_version, biolink_version)
+    ara_metadata, kp_metadata = get_test_metadata(metafunc, trapi_version, biolink_version)
 
-    trapi_kp_edges = generate_trapi_kp_tests(metafunc, kp_metadata)
+    _, trapi_kp_source_edges = generate_trapi_kp_tests(metafunc, kp_metadata)
 
     if metafunc.definition.name == 'test_trapi_aras':
-        generate_trapi_ara_tests(metafunc, trapi_kp_edges, ara_metadata)
+        generate_trapi_ara_tests(metafunc, trapi_kp_source_edges, ara_metadata)
@@ -63,46 +63,58 @@ def _report_and_skip_edge(scope: str, test, test_case: Dict, test_report: UnitTe
         )
 
 
-@pytest.mark.asyncio
-async def test_trapi_kps(kp_trapi_case, trapi_creator, results_bag):
-    """Generic Test for TRAPI KPs. The kp_trapi_case fixture is created in conftest.py by looking at KP test triples
-    These get successively fed into test_trapi_kps.  This function is further parameterized by trapi_creator, which
-    knows how to take an input edge and create some kind of TRAPI query from it.  For instance, by_subject removes
-    the object, while raise_object_by_subject removes the object and replaces the object category with its
-    biolink parent. This approach will need modification if there turn out to be particular elements we want
-    to test for different creators.
+async def _run_one_hop_unit_test(scope: str, test_case: Dict, trapi_creator, results_bag):
     """
-    results_bag.location = kp_trapi_case['ks_test_data_location']
-    results_bag.case = kp_trapi_case
+    Common body of the KP and ARA one hop unit tests.
+
+    :param scope: str, 'KP' or 'ARA'
+    :param test_case: input edge data unit test case
+    :param trapi_creator: the particular unit test being run
+    :param results_bag: Pytest Harvest results bag of the unit test
+    """
+    results_bag.case = test_case
     results_bag.unit_test_report = UnitTestReport(
-        test_case=kp_trapi_case,
+        test_case=test_case,
         test_name=trapi_creator.__name__
     )
 
-    if in_excluded_tests(test=trapi_creator, test_case=kp_trapi_case):
+    if in_excluded_tests(test=trapi_creator, test_case=test_case):
         _report_and_skip_edge(
-            "KP",
+            scope,
             test=trapi_creator,
-            test_case=kp_trapi_case,
+            test_case=test_case,
             test_report=results_bag.unit_test_report,
             excluded_test=True
         )
-    elif UnitTestReport.test_case_has_validation_errors("pre-validation", kp_trapi_case):
+    elif UnitTestReport.test_case_has_validation_errors("pre-validation", test_case):
         _report_and_skip_edge(
-            "KP",
+            scope,
             test=trapi_creator,
-            test_case=kp_trapi_case,
+            test_case=test_case,
             test_report=results_bag.unit_test_report
         )
     else:
         await execute_trapi_lookup(
-            case=kp_trapi_case,
+            case=test_case,
             creator=trapi_creator,
             results_bag=results_bag
         )
         results_bag.unit_test_report.assert_test_outcome()
 
 
+@pytest.mark.asyncio
+async def test_trapi_kps(kp_trapi_case, trapi_creator, results_bag):
+    """Generic Test for TRAPI KPs. The kp_trapi_case fixture is created in conftest.py by looking at KP test triples
+    These get successively fed into test_trapi_kps.  This function is further parameterized by trapi_creator, which
+    knows how to take an input edge and create some kind of TRAPI query from it.  For instance, by_subject removes
+    the object, while raise_object_by_subject removes the object and replaces the object category with its
+    biolink parent. This approach will need modification if there turn out to be particular elements we want
+    to test for different creators.
+    """
+    results_bag.location = kp_trapi_case['ks_test_data_location']
+    await _run_one_hop_unit_test("KP", kp_trapi_case, trapi_creator, results_bag)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "trapi_creator",
@@ -122,30 +134,4 @@ async def test_trapi_aras(ara_trapi_case, trapi_creator, results_bag):
     that the provenance is correct.
     """
     results_bag.location = ara_trapi_case['ara_test_config_location']
-    results_bag.case = ara_trapi_case
-    results_bag.unit_test_report = UnitTestReport(
-        test_case=ara_trapi_case,
-        test_name=trapi_creator.__name__
-    )
-    if in_excluded_tests(test=trapi_creator, test_case=ara_trapi_case):
-        _report_and_skip_edge(
-            "ARA",
-            test=trapi_creator,
-            test_case=ara_trapi_case,
-            test_report=results_bag.unit_test_report,
-            excluded_test=True
-        )
-    elif UnitTestReport.test_case_has_validation_errors("pre-validation", ara_trapi_case):
-        _report_and_skip_edge(
-            "ARA",
-            test=trapi_creator,
-            test_case=ara_trapi_case,
-            test_report=results_bag.unit_test_report
-        )
-    else:
-        await execute_trapi_lookup(
-            case=ara_trapi_case,
-            creator=trapi_creator,
-            results_bag=results_bag
-        )
-        results_bag.unit_test_report.assert_test_outcome()
+    await _run_one_hop_unit_test("ARA", ara_trapi_case, trapi_creator, results_bag)
@@ -1,7 +1,5 @@
-from copy import deepcopy
-from dataclasses import asdict
-from functools import wraps
-from typing import Set, Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import FrozenSet, Dict, List, Set, Tuple, Optional
 
 from bmt import utils
 from reasoner_validator.versioning import SemVer
@@ -9,32 +7,71 @@ from reasoner_validator.biolink import get_biolink_model_toolkit, BiolinkValidat
 from sri_testing.translator.sri.testing.util import ontology_kp
 
 
-def create_one_hop_message(edge, look_up_subject: bool = False) -> Tuple[Optional[Dict], str]:
+# TRAPI releases up to, and including, this release are not supported by SRI Testing
+_LEGACY_TRAPI_VERSION: SemVer = SemVer.from_string("1.1.0")
+
+
+@lru_cache(maxsize=64)
+def _is_legacy_trapi_version(trapi_version: str) -> bool:
+    """
+    Checks if a TRAPI version is a legacy release (only parsed once per distinct version string).
+
+    :param trapi_version: str, SemVer of the TRAPI release being tested
+    :return: bool, True if the TRAPI release is unsupported by SRI Testing
+    """
+    return SemVer.from_string(trapi_version) <= _LEGACY_TRAPI_VERSION
+
+
+def _edge_node_id(edge: Dict, target: str) -> str:
+    """
+    Resolves the identifier of a test edge node, preferring any explicit '<target>_id' over the plain node value.
+
+    :param edge: Dict, test edge data
+    :param target: str, edge node target, either "subject" or "object"
+    :return: str, identifier of the edge node
+    """
+    node_id: Optional[str] = edge.get(f"{target}_id")
+    return node_id if node_id is not None else edge[target]
+
+
+def create_one_hop_message(
+        edge,
+        look_up_subject: bool = False,
+        *,
+        subject_category: Optional[str] = None,
+        object_category: Optional[str] = None,
+        predicate: Optional[str] = None,
+        subject_id: Optional[str] = None,
+        object_id: Optional[str] = None,
+        qualifiers: Optional[List[Dict]] = None
+) -> Tuple[Optional[Dict], str]:
     """Given a complete edge, create a valid TRAPI message for "one hop" querying for the edge.
     If the look_up_subject is False (default) then the object id is not included, (lookup object
     by subject) and if the look_up_subject is True, then the subject id is not included (look up
-    subject by object)"""
+    subject by object). Unit tests transforming the edge pass the transformed values as keyword
+    overrides of the corresponding edge fields, rather than building a modified copy of the edge."""
 
-    trapi_version_tested = SemVer.from_string(edge['trapi_version'])
-    if trapi_version_tested <= SemVer.from_string("1.1.0"):
+    if _is_legacy_trapi_version(edge['trapi_version']):
         return None, f"Legacy TRAPI version '{str(edge['trapi_version'])}' unsupported by SRI Testing!"
 
     q_edge: Dict = {
         "subject": "a",
         "object": "b",
-        "predicates": [edge['predicate']]
+        "predicates": [predicate if predicate is not None else edge['predicate']]
     }
 
     # Build Biolink 3 compliant QEdge qualifier_constraints, if specified
-    if 'qualifiers' in edge:
+    if qualifiers is None:
+        qualifiers = edge.get('qualifiers')
+    if qualifiers is not None:
         # We don't validate the edge['qualifiers'] here.. let the TRAPI query catch any faulty qualifiers
         qualifier_set: List = list()
         qualifier: Dict
-        for qualifier in edge['qualifiers']:
+        for qualifier in qualifiers:
             if 'qualifier_type_id' in qualifier and 'qualifier_value' in qualifier:
                 qualifier_set.append(qualifier.copy())
             else:
-                return None, f"Malformed 'qualifiers' specification: '{str(edge['qualifiers'])}'!"
+                return None, f"Malformed 'qualifiers' specification: '{str(qualifiers)}'!"
 
         if qualifier_set:
             q_edge['qualifier_constraints'] = [{'qualifier_set': qualifier_set}]
@@ -43,29 +80,25 @@ def create_one_hop_message(edge, look_up_subject: bool = False) -> Tuple[Optiona
         #  to validate query (qualifiers)? Ask Sierra for advice?
         pass
 
-    query_graph: Dict = {
-        "nodes": {
-            'a': {
-                "categories": [edge['subject_category']]
-            },
-            'b': {
-                "categories": [edge['object_category']]
-            }
-        },
-        "edges": {
-            'ab': q_edge
-        }
+    # the query node bearing the known identifier is built
+    # in one step, rather than patched after construction
+    subject_node: Dict = {
+        "categories": [subject_category if subject_category is not None else edge['subject_category']]
+    }
+    object_node: Dict = {
+        "categories": [object_category if object_category is not None else edge['object_category']]
     }
     if look_up_subject:
-        object_id = edge['object_id'] if 'object_id' in edge else edge['object']
-        query_graph['nodes']['b']['ids'] = [object_id]
+        object_node["ids"] = [object_id if object_id is not None else _edge_node_id(edge, "object")]
     else:
-        subject_id = edge['subject_id'] if 'subject_id' in edge else edge['subject']
-        query_graph['nodes']['a']['ids'] = [subject_id]
+        subject_node["ids"] = [subject_id if subject_id is not None else _edge_node_id(edge, "subject")]
 
     message: Dict = {
         "message": {
-            "query_graph": query_graph,
+            "query_graph": {
+                "nodes": {'a': subject_node, 'b': object_node},
+                "edges": {'ab': q_edge}
+            },
             'knowledge_graph': {
                 "nodes": {}, "edges": {},
             },
@@ -105,40 +138,52 @@ def get_unit_test_definitions() -> Dict:
     return _unit_test_definitions.copy()
 
 
-def get_unit_test_codes() -> Set[str]:
-    global _unit_tests
-    return set(_unit_tests.keys())
+def get_unit_test_codes() -> FrozenSet[str]:
+    return _UNIT_TEST_CODES
 
 
 def get_unit_test_name(code: str) -> str:
-    global _unit_tests
     return _unit_tests[code]
 
 
-def get_unit_test_list() -> List[str]:
-    global _unit_tests
-    return list(_unit_tests.values())
+def get_unit_test_list() -> Tuple[str, ...]:
+    return _UNIT_TEST_LIST
+
+
+@lru_cache(maxsize=1024)
+def _excluded_test_names(excluded_tests: Tuple[str, ...]) -> FrozenSet[str]:
+    """
+    Resolves the unit test names of a given sequence of excluded test codes.
+
+    :param excluded_tests: Tuple[str, ...], unit test codes excluded by a test case
+    :return: FrozenSet[str], names of the excluded unit tests
+    :raises RuntimeError: if any of the test codes is unknown
+    """
+    excluded_test_names: Set[str] = set()
+    for code in excluded_tests:
+        excluded_test_name: Optional[str] = _unit_tests.get(code)
+        if excluded_test_name is None:
+            raise RuntimeError(
+                f"in_excluded_tests(): invalid test_case['exclude_tests'] code? " +
+                f"'{str(list(excluded_tests))}': '{str(code)}'"
+            )
+        excluded_test_names.add(excluded_test_name)
+    return frozenset(excluded_test_names)
 
 
 def in_excluded_tests(test, test_case) -> bool:
-    global _unit_tests
-    try:
-        test_name = test.__name__
-    except AttributeError:
+    test_name: Optional[str] = getattr(test, "__name__", None)
+    if test_name is None:
         raise RuntimeError(f"in_excluded_tests(): invalid 'test' parameter: '{str(test)}'")
-    try:
-        if "exclude_tests" in test_case:
-            # returns 'true' if the test_name corresponds to a test in the list of excluded test (codes)
-            return any([test_name == get_unit_test_name(code) for code in test_case["exclude_tests"]])
-    except TypeError as te:
-        raise RuntimeError(f"in_excluded_tests(): invalid 'test_case' parameter: '{str(test_case)}': {str(te)}")
-    except KeyError as ke:
-        raise RuntimeError(
-            f"in_excluded_tests(): invalid test_case['excluded_test'] code? " +
-            f"'{str(test_case['excluded_tests'])}': {str(ke)}"
-        )
+    if not isinstance(test_case, dict):
+        raise RuntimeError(f"in_excluded_tests(): invalid 'test_case' parameter: '{str(test_case)}'")
+
+    excluded_tests = test_case.get("exclude_tests")
+    if not excluded_tests:
+        return False
 
-    return False
+    # returns 'true' if the test_name corresponds to a test in the set of excluded test (codes)
+    return test_name in _excluded_test_names(tuple(excluded_tests))
 
 
 class TestCode:
@@ -146,18 +191,14 @@ class TestCode:
     Assigns a shorthand test code to a unit test method.
     """
     def __init__(self, code: str, unit_test_name: str, description: str):
-        global _unit_tests
         self.code = code
         self.method = unit_test_name
         _unit_tests[code] = unit_test_name
         _unit_test_definitions[unit_test_name] = description
 
     def __call__(self, fn):
-        @wraps(fn)
-        def wrapper(*args, **kwargs):
-            result = fn(*args, **kwargs)
-            return result
-        return wrapper
+        # the unit test is registered by the constructor, so the method itself is returned as is
+        return fn
 
 
 @TestCode(
@@ -213,6 +254,19 @@ def invert_association(association: str):
     return association  # stub - just return original association (probably wrong!)
 
 
+@lru_cache(maxsize=1024)
+def _get_inverse_predicate(biolink_version: Optional[str], predicate: str) -> Optional[str]:
+    """
+    Retrieves the inverse of a Biolink Model predicate, only resolved once per (model version, predicate) pair.
+
+    :param biolink_version: Optional[str], SemVer of the Biolink Model release
+    :param predicate: str, CURIE of the predicate to be inverted
+    :return: Optional[str], CURIE of the inverse predicate (the predicate itself if symmetric); None if unknown
+    """
+    validator: BiolinkValidator = BiolinkValidator(biolink_version=biolink_version)
+    return validator.get_inverse_predicate(predicate)
+
+
 @TestCode(
     code="IBNS",
     unit_test_name="inverse_by_new_subject",
@@ -226,35 +280,26 @@ def inverse_by_new_subject(request):
              if trapi_request is None, then error details returned in two other tuple elements
     """
     predicate = request['predicate']
-    context: str = f"inverse_by_new_subject|predicate '{str(request['predicate'])}'"
+    context: str = f"inverse_by_new_subject|predicate '{str(predicate)}'"
 
-    validator: BiolinkValidator = BiolinkValidator(biolink_version=request['biolink_version'])
-    inverse_predicate = validator.get_inverse_predicate(predicate)
+    inverse_predicate = _get_inverse_predicate(request['biolink_version'], predicate)
 
     # Not everything has an inverse (it should, and it will, but it doesn't right now)
     if inverse_predicate is None:
         reason: str = "is an unknown or has no inverse?"
         return None, context, reason
 
-    # probably don't need to worry here but just-in-case
-    # only work off a copy of the original request...
-    transformed_request = request.copy()
-    transformed_request.update({
-        "subject_category": request['object_category'],
-        "object_category": request['subject_category'],
-        "predicate": inverse_predicate,
-        "subject_id":
-            request["object_id"] if "object_id" in request else request["object"],
-        "object_id":
-            request["subject_id"] if "subject_id" in request else request["subject"]
-    })
-
-    if 'qualifiers' in request:
-        transformed_request['qualifiers'] = swap_qualifiers(request['qualifiers'])
-    if 'association' in request:
-        transformed_request['association'] = invert_association(request['association'])
-
-    message, errmsg = create_one_hop_message(transformed_request)
+    # the original request is left untouched: the inverted edge is passed as overrides
+    # (note: an 'association' is not yet used to build the query, so isn't inverted here)
+    message, errmsg = create_one_hop_message(
+        request,
+        subject_category=request['object_category'],
+        object_category=request['subject_category'],
+        predicate=inverse_predicate,
+        subject_id=_edge_node_id(request, "object"),
+        object_id=_edge_node_id(request, "subject"),
+        qualifiers=swap_qualifiers(request['qualifiers']) if 'qualifiers' in request else None
+    )
 
     # We inverted the predicate, and will be querying by the new subject, so the output will be in node b
     # but, the entity we are looking for (now the object) was originally the subject because of the inversion.
@@ -282,6 +327,28 @@ def by_object(request):
         return None, f"by_object|object '{str(request['object'])}'", errmsg
 
 
+# Biolink Model element fields consulted by the unit tests below
+_BIOLINK_ELEMENT_FIELDS: Tuple[str, ...] = ('name', 'is_a', 'mixin', 'abstract', 'deprecated')
+
+
+@lru_cache(maxsize=1024)
+def _get_biolink_element(biolink_version: Optional[str], name: str) -> Optional[Dict]:
+    """
+    Retrieves a Biolink Model element, as a dictionary, only looked up once per (model version, element) pair.
+    The returned dictionary is shared by all callers, hence should be treated as read-only.
+    Only the element fields consulted by the unit tests (and no_parent_error()) are copied
+    from the element (rather than converting the whole element dataclass with asdict()).
+
+    :param biolink_version: Optional[str], SemVer of the Biolink Model release
+    :param name: str, name (or CURIE) of the Biolink Model element
+    :return: Optional[Dict], Biolink Model element as a dictionary; None if unknown
+    """
+    element = get_biolink_model_toolkit(biolink_version=biolink_version).get_element(name)
+    if not element:
+        return None
+    return {field: getattr(element, field, None) for field in _BIOLINK_ELEMENT_FIELDS}
+
+
 def no_parent_error(
         unit_test_name: str,
         element_type: str,
@@ -290,11 +357,11 @@ def no_parent_error(
 ) -> Tuple[None, str, str]:
     context: str = f"{unit_test_name}|{element_type} '{str(element['name'])}'"
     reason: str = "has no 'is_a' parent"
-    if 'mixin' in element and element['mixin']:
+    if element.get('mixin'):
         reason += " and is a mixin"
-    if 'abstract' in element and element['abstract']:
+    if element.get('abstract'):
         reason += " and is abstract"
-    if 'deprecated' in element and element['deprecated']:
+    if element.get('deprecated'):
         reason += " and is deprecated"
     if suffix:
         reason += suffix
@@ -316,7 +383,7 @@ def raise_entity(request, target: str):
     assert target in ["subject", "object"]
 
     category = request[f"{target}_category"]
-    entity = request[f"{target}_id"] if f"{target}_id" in request else request[target]
+    entity = _edge_node_id(request, target)
     parent_entity = ontology_kp.get_parent(entity, category, biolink_version=request['biolink_version'])
     if parent_entity is None:
         return no_parent_error(
@@ -325,9 +392,7 @@ def raise_entity(request, target: str):
             element={'name': f"{entity}[{category}]"},
             suffix=" since it is either not an ontology term or does not map onto a parent ontology term."
         )
-    mod_request = deepcopy(request)
-    mod_request[target] = parent_entity
-    message, errmsg = create_one_hop_message(mod_request)
+    message, errmsg = create_one_hop_message(request, **{f"{target}_id": parent_entity})
     if message:
         # query the opposing association node partner here
         return message, "subject" if target == "object" else "object", 'a'
@@ -379,13 +444,13 @@ def raise_object_by_subject(request):
     :return: Tuple, (trapi_request, output_element, output_node_binding);
              if trapi_request is None, then error details returned in two other tuple elements
     """
-    tk = get_biolink_model_toolkit(biolink_version=request['biolink_version'])
-    original_object_element = tk.get_element(request['object_category'])
-    if original_object_element:
-        original_object_element = asdict(original_object_element)
-    else:
+    biolink_version = request['biolink_version']
+    object_category = request['object_category']
+
+    original_object_element = _get_biolink_element(biolink_version, object_category)
+    if not original_object_element:
         original_object_element = dict()
-        original_object_element['name'] = request['object_category']
+        original_object_element['name'] = object_category
         original_object_element['is_a'] = None
     if original_object_element['is_a'] is None:
         # This element may be a mixin or abstract, without any parent?
@@ -394,14 +459,16 @@ def raise_object_by_subject(request):
             "object category",
             original_object_element
         )
-    transformed_request = request.copy()  # there's no depth to request, so it's ok
+    tk = get_biolink_model_toolkit(biolink_version=biolink_version)
     parent = tk.get_parent(original_object_element['name'])
-    transformed_request['object_category'] = utils.format_element(tk.get_element(parent))
-    message, errmsg = create_one_hop_message(transformed_request)
+    message, errmsg = create_one_hop_message(
+        request,
+        object_category=utils.format_element(tk.get_element(parent))
+    )
     if message:
         return message, 'object', 'b'
     else:
-        return None, f"raise_object_by_subject|object_category '{str(request['object_category'])}'", errmsg
+        return None, f"raise_object_by_subject|object_category '{str(object_category)}'", errmsg
 
 
 @TestCode(
@@ -417,15 +484,13 @@ def raise_predicate_by_subject(request):
              if trapi_request is None, then error details returned in two other tuple elements
     """
     predicate = request['predicate']
+    biolink_version = request['biolink_version']
 
-    tk = get_biolink_model_toolkit(biolink_version=request['biolink_version'])
-    transformed_request = request.copy()  # there's no depth to request, so it's ok
-
+    # the 'biolink:related_to' root predicate is queried as is
+    parent_predicate: Optional[str] = None
     if predicate != 'biolink:related_to':
-        original_predicate_element = tk.get_element(predicate)
-        if original_predicate_element:
-            original_predicate_element = asdict(original_predicate_element)
-        else:
+        original_predicate_element = _get_biolink_element(biolink_version, predicate)
+        if not original_predicate_element:
             original_predicate_element = dict()
             original_predicate_element['name'] = predicate
             original_predicate_element['is_a'] = None
@@ -436,10 +501,17 @@ def raise_predicate_by_subject(request):
                 "predicate",
                 original_predicate_element
             )
-        transformed_request['predicate'] = tk.get_parent(original_predicate_element['name'], formatted=True)
+        tk = get_biolink_model_toolkit(biolink_version=biolink_version)
+        parent_predicate = tk.get_parent(original_predicate_element['name'], formatted=True)
 
-    message, errmsg = create_one_hop_message(transformed_request)
+    message, errmsg = create_one_hop_message(request, predicate=parent_predicate)
     if message:
         return message, 'object', 'b'
     else:
-        return None, f"raise_predicate_by_subject|predicate '{str(request['predicate'])}'", errmsg
+        return None, f"raise_predicate_by_subject|predicate '{str(predicate)}'", errmsg
+
+
+# All the unit tests are registered by the TestCode decorated functions above,
+# so their (immutable) catalog of codes and names may be built once, at import
+_UNIT_TEST_CODES: FrozenSet[str] = frozenset(_unit_tests)
+_UNIT_TEST_LIST: Tuple[str, ...] = tuple(_unit_tests.values())
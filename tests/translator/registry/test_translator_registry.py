@@ -2,16 +2,16 @@
 Unit tests for Translator SmartAPI Registry
 """
 from sys import stderr
-from typing import Optional, Union, Tuple, Dict, List
+from typing import Optional, Union, Tuple, Dict, List, Mapping
+from types import MappingProxyType
 import logging
 import pytest
 
 from sri_testing.translator.registry import (
-    MOCK_REGISTRY,
+    is_mock_registry,
     get_default_url,
     rewrite_github_url,
     query_smart_api,
-    SMARTAPI_QUERY_PARAMETERS,
     tag_value,
     get_the_registry_data,
     extract_component_test_metadata_from_registry,
@@ -43,35 +43,37 @@ STAGING_KP_BASEURL = "https://molepro-trapi.ci.transltr.io/molepro/trapi/v"
 TESTING_KP_BASEURL = "https://molepro-trapi.test.transltr.io/molepro/trapi/v"
 DEVELOPMENT_KP_BASEURL = "https://translator.broadinstitute.org/molepro/trapi/v"
 
+
+def _server_entry(component: str, x_maturity: str, url: str) -> Mapping[str, str]:
+    """
+    Builds a Registry 'servers' block entry for a test TRAPI endpoint. The entries are shared
+    by many test queries below, hence are returned read-only, to guard against any mutation.
+
+    :param component: str, Translator component type, i.e. "KP" or "ARA"
+    :param x_maturity: str, x-maturity environment of the endpoint
+    :param url: str, URL of the endpoint
+    :return: Mapping[str, str], read-only Registry 'servers' block entry
+    """
+    return MappingProxyType({
+        'description': f'{component} TRAPI {DEF_M_M_TRAPI} endpoint - {x_maturity}',
+        'url': url,
+        'x-maturity': x_maturity
+    })
+
+
 PRODUCTION_KP_SERVER_URL = f"{PRODUCTION_KP_BASEURL}{DEF_M_M_TRAPI}"
-PRODUCTION_KP_SERVER = {
-    'description': f'KP TRAPI {DEF_M_M_TRAPI} endpoint - production',
-    'url': PRODUCTION_KP_SERVER_URL,
-    'x-maturity': 'production'
-}
+PRODUCTION_KP_SERVER = _server_entry("KP", "production", PRODUCTION_KP_SERVER_URL)
 
 STAGING_KP_SERVER_URL = f"{STAGING_KP_BASEURL}{DEF_M_M_TRAPI}"
-STAGING_KP_SERVER = {
-    'description': f'KP TRAPI {DEF_M_M_TRAPI} endpoint - testing',
-    'url': STAGING_KP_SERVER_URL,
-    'x-maturity': 'staging'
-}
+STAGING_KP_SERVER = _server_entry("KP", "staging", STAGING_KP_SERVER_URL)
 
 TESTING_KP_SERVER_URL = f"{TESTING_KP_BASEURL}{DEF_M_M_TRAPI}"
-TESTING_KP_SERVER = {
-    'description': f'KP TRAPI {DEF_M_M_TRAPI} endpoint - staging',
-    'url': TESTING_KP_SERVER_URL,
-    'x-maturity': 'testing'
-}
+TESTING_KP_SERVER = _server_entry("KP", "testing", TESTING_KP_SERVER_URL)
 
 DEVELOPMENT_KP_SERVER_URL = f"{DEVELOPMENT_KP_BASEURL}{DEF_M_M_TRAPI}"
-DEVELOPMENT_KP_SERVER = {
-    'description': f'KP TRAPI {DEF_M_M_TRAPI} endpoint - development',
-    'url': DEVELOPMENT_KP_SERVER_URL,
-    'x-maturity': 'development'
-}
+DEVELOPMENT_KP_SERVER = _server_entry("KP", "development", DEVELOPMENT_KP_SERVER_URL)
 
-KP_SERVERS_BLOCK = [PRODUCTION_KP_SERVER, STAGING_KP_SERVER, TESTING_KP_SERVER, DEVELOPMENT_KP_SERVER]
+KP_SERVERS_BLOCK = (PRODUCTION_KP_SERVER, STAGING_KP_SERVER, TESTING_KP_SERVER, DEVELOPMENT_KP_SERVER)
 
 
 ARA_INFORES = "biothings-explorer"
@@ -79,27 +81,15 @@ ARA_TEST_DATA_URL = "https://raw.githubusercontent.com/NCATS-Tangerine/translato
                     "master/biothings_explorer/sri-test-bte-ara.json"
 
 PRODUCTION_ARA_SERVER_URL = "https://bte.transltr.io/v1"
-PRODUCTION_ARA_SERVER = {
-    'description': f'ARA TRAPI {DEF_M_M_TRAPI} endpoint - production',
-    'url': PRODUCTION_ARA_SERVER_URL,
-    'x-maturity': 'production'
-}
+PRODUCTION_ARA_SERVER = _server_entry("ARA", "production", PRODUCTION_ARA_SERVER_URL)
 
 TESTING_ARA_SERVER_URL = "https://bte.test.transltr.io/v1"
-TESTING_ARA_SERVER = {
-    'description': f'ARA TRAPI {DEF_M_M_TRAPI} endpoint - staging',
-    'url': TESTING_ARA_SERVER_URL,
-    'x-maturity': 'testing'
-}
+TESTING_ARA_SERVER = _server_entry("ARA", "testing", TESTING_ARA_SERVER_URL)
 
 DEVELOPMENT_ARA_SERVER_URL = "https://api.bte.ncats.io/v1"
-DEVELOPMENT_ARA_SERVER = {
-    'description': f'ARA TRAPI {DEF_M_M_TRAPI} endpoint - development',
-    'url': DEVELOPMENT_ARA_SERVER_URL,
-    'x-maturity': 'development'
-}
+DEVELOPMENT_ARA_SERVER = _server_entry("ARA", "development", DEVELOPMENT_ARA_SERVER_URL)
 
-ARA_SERVERS_BLOCK = [PRODUCTION_ARA_SERVER, PRODUCTION_ARA_SERVER, TESTING_ARA_SERVER, DEVELOPMENT_ARA_SERVER]
+ARA_SERVERS_BLOCK = (PRODUCTION_ARA_SERVER, PRODUCTION_ARA_SERVER, TESTING_ARA_SERVER, DEVELOPMENT_ARA_SERVER)
 
 
 @pytest.mark.parametrize(
@@ -174,7 +164,7 @@ def test_get_default_url(query: Tuple[Optional[Union[str, List, Dict]], str]):
 
         # This particular endpoint is valid and online as of 15 May 2023
         # but may need to be revised in the future, as Translator resources evolve?
-        (f"{STAGING_KP_BASEURL}{DEF_M_M_TRAPI}", True)
+        (STAGING_KP_SERVER_URL, True)
     ]
 )
 def test_live_trapi_endpoint(url: str, outcome: bool):
@@ -182,6 +172,15 @@ def test_live_trapi_endpoint(url: str, outcome: bool):
     assert (data is not None) is outcome
 
 
+# server_urls with an endpoint for every x-maturity, shared by (read only) select_endpoint() test queries
+_ALL_X_MATURITY_SERVER_URLS: Dict[str, List[str]] = {
+    'testing': ["http://testing_endpoint"],
+    'development': ["http://development_endpoint"],
+    'production': ["http://production_endpoint"],
+    'staging': ["http://staging_endpoint"]
+}
+
+
 # def select_endpoint(
 #         server_urls: Dict[str, List],
 #         test_data_location: Optional[Union[str, List, Dict]]
@@ -193,12 +192,7 @@ def test_live_trapi_endpoint(url: str, outcome: bool):
         (dict(), list(), None),  # Query 1: empty parameters - variant 2
         (dict(), dict(), None),  # Query 2: empty parameters - variant 3
         (   # Query 3 - complete server_urls for all x-maturity; simple string URL text_data_location
-            {
-                'testing': ["http://testing_endpoint"],
-                'development': ["http://development_endpoint"],
-                'production': ["http://production_endpoint"],
-                'staging': ["http://staging_endpoint"]
-            },
+            _ALL_X_MATURITY_SERVER_URLS,
             "http://test_data",
             (
                 "http://production_endpoint",
@@ -207,12 +201,7 @@ def test_live_trapi_endpoint(url: str, outcome: bool):
             )
         ),
         (   # Query 4 - complete server_urls for all x-maturity; direct list of string URLs text_data_location
-            {
-                'testing': ["http://testing_endpoint"],
-                'development': ["http://development_endpoint"],
-                'production': ["http://production_endpoint"],
-                'staging': ["http://staging_endpoint"]
-            },
+            _ALL_X_MATURITY_SERVER_URLS,
             [
                 "http://test_data_1",
                 "http://test_data_2",
@@ -227,12 +216,7 @@ def test_live_trapi_endpoint(url: str, outcome: bool):
             )
         ),
         (   # Query 5 - complete server_urls for all x-maturity; full JSON object text_data_location without 'default'
-            {
-                'testing': ["http://testing_endpoint"],
-                'development': ["http://development_endpoint"],
-                'production': ["http://production_endpoint"],
-                'staging': ["http://staging_endpoint"]
-            },
+            _ALL_X_MATURITY_SERVER_URLS,
             {
                 'testing': "http://testing_test_data",
                 'development': "http://development_test_data",
@@ -246,12 +230,7 @@ def test_live_trapi_endpoint(url: str, outcome: bool):
             )
         ),
         (   # Query 6 - complete server_urls for all x-maturity; JSON object text_data_location with just 'default'
-            {
-                'testing': ["http://testing_endpoint"],
-                'development': ["http://development_endpoint"],
-                'production': ["http://production_endpoint"],
-                'staging': ["http://staging_endpoint"]
-            },
+            _ALL_X_MATURITY_SERVER_URLS,
             {
                 'default': "http://default_test_data"
             },
@@ -302,12 +281,7 @@ def test_live_trapi_endpoint(url: str, outcome: bool):
             )
         ),
         (   # Query 10 - full server_urls for x-maturity; JSON object text_data_location with only one x-maturity
-            {
-                'testing': ["http://testing_endpoint"],
-                'development': ["http://development_endpoint"],
-                'production': ["http://production_endpoint"],
-                'staging': ["http://staging_endpoint"]
-            },
+            _ALL_X_MATURITY_SERVER_URLS,
             {
                 'development': "http://development_test_data"
             },
@@ -320,12 +294,7 @@ def test_live_trapi_endpoint(url: str, outcome: bool):
         (   # Query 11 - full server_urls for x-maturity; JSON object
             #            text_data_location with one x-maturity + default
             #            Since a production url can pick up the default test data, it wins(?)
-            {
-                'testing': ["http://testing_endpoint"],
-                'development': ["http://development_endpoint"],
-                'production': ["http://production_endpoint"],
-                'staging': ["http://staging_endpoint"]
-            },
+            _ALL_X_MATURITY_SERVER_URLS,
             {
                 'default': "http://default_test_data",
                 'development': "http://development_test_data"
@@ -338,12 +307,7 @@ def test_live_trapi_endpoint(url: str, outcome: bool):
         ),
         (   # Query 12 - full server_urls for x-maturity;
             #            JSON object text_data_location with one x-maturity  with list of test data URLs
-            {
-                'testing': ["http://testing_endpoint"],
-                'development': ["http://development_endpoint"],
-                'production': ["http://production_endpoint"],
-                'staging': ["http://staging_endpoint"]
-            },
+            _ALL_X_MATURITY_SERVER_URLS,
             {
                 'development': [
                     "http://development_test_data_1",
@@ -365,40 +329,45 @@ def test_select_endpoint(query: Tuple):
     assert select_endpoint(query[0], query[1], check_access=False) == query[2]
 
 
+# TRAPI endpoints deemed 'live' by the simulated endpoint access checks of test_select_endpoint_with_checking
+_LIVE_TRAPI_ENDPOINTS = {
+    STAGING_KP_SERVER_URL,
+    PRODUCTION_KP_SERVER_URL
+}
+
+
 @pytest.mark.parametrize(
     "server_urls,test_data_location,outcome,endpoint,x_maturity,test_data",
     [
         (   # Query 0 - resolvable endpoint for a defined 'x-maturity'
-            # These particular test details are valid and the indicated TRAPI endpoint 'alive' as of
-            # 15 May 2023, but may need to be revised in the future, as Translator resources evolve?
+            # The indicated TRAPI endpoint is one of the (simulated) _LIVE_TRAPI_ENDPOINTS above
             {   # server_url
-                'development': [f'{STAGING_KP_BASEURL}{DEF_M_M_TRAPI}'],
+                'development': [STAGING_KP_SERVER_URL],
             },
             {   # test_data_location
                 'development': KP_TEST_DATA_URL
             },
             True,  # outcome
-            f'{STAGING_KP_BASEURL}{DEF_M_M_TRAPI}',  # endpoint
+            STAGING_KP_SERVER_URL,  # endpoint
             "development",  # x_maturity
             KP_TEST_DATA_URL   # test_data
         ),
         (   # Query 1 - resolvable endpoint test data resolved from a default
-            # These particular test details are valid and the indicated TRAPI endpoint 'alive' as of
-            # 15 May 2023, but may need to be revised in the future, as Translator resources evolve?
+            # The indicated TRAPI endpoint is one of the (simulated) _LIVE_TRAPI_ENDPOINTS above
             {   # server_url
-                'development': [f'{STAGING_KP_BASEURL}{DEF_M_M_TRAPI}'],
+                'development': [STAGING_KP_SERVER_URL],
             },
             {   # test_data_location
                 'default': KP_TEST_DATA_URL
             },
             True,  # outcome
-            f'{STAGING_KP_BASEURL}{DEF_M_M_TRAPI}',  # endpoint
+            STAGING_KP_SERVER_URL,  # endpoint
             "development",  # x_maturity
             KP_TEST_DATA_URL   # test_data
         ),
         (   # Query 2 - unresolvable endpoint test data - no available test data for the specified 'x-maturity'?
             {  # server_url
-                'development': [f'{PRODUCTION_KP_BASEURL}{DEF_M_M_TRAPI}'],
+                'development': [PRODUCTION_KP_SERVER_URL],
             },
             {  # test_data_location
                 'testing': KP_TEST_DATA_URL
@@ -423,6 +392,7 @@ def test_select_endpoint(query: Tuple):
     ]
 )
 def test_select_endpoint_with_checking(
+        monkeypatch,
         server_urls: Dict[str, List[str]],
         test_data_location: Optional[Union[str, List, Dict]],
         outcome: bool,
@@ -430,6 +400,13 @@ def test_select_endpoint_with_checking(
         x_maturity: str,
         test_data: Union[str, List[str]]
 ):
+    # The TRAPI endpoint access checks are simulated here, so that this test
+    # doesn't depend on the current availability of Translator resources online
+    # (test_live_trapi_endpoint above exercises the real endpoint check)
+    monkeypatch.setattr(
+        "sri_testing.translator.registry.live_trapi_endpoint",
+        lambda url: dict() if url in _LIVE_TRAPI_ENDPOINTS else None
+    )
     endpoint_details = select_endpoint(server_urls, test_data_location)
     if outcome:
         assert endpoint_details is not None
@@ -479,42 +456,46 @@ def test_fake_url():
 
 
 def test_query_smart_api():
-    registry_data = query_smart_api(parameters=SMARTAPI_QUERY_PARAMETERS)
+    # get_the_registry_data() runs query_smart_api(parameters=SMARTAPI_QUERY_PARAMETERS)
+    # only once, then shares the Registry catalog with the other tests of this module
+    registry_data = get_the_registry_data()
     assert "total" in registry_data, f"\tMissing 'total' tag in results?"
     assert registry_data["total"] > 0, f"\tZero 'total' in results?"
     assert "hits" in registry_data, f"\tMissing 'hits' tag in results?"
+    # each tag is looked up just once, with dict.get(), rather than checked for then indexed;
+    # the debug messages are only formatted by the logger if debug logging is enabled
     for index, service in enumerate(registry_data['hits']):
-        if "info" not in service:
-            logger.debug(f"\tMissing 'hits' tag in hit entry? Ignoring entry...")
+        info = service.get("info")
+        if info is None:
+            logger.debug("\tMissing 'hits' tag in hit entry? Ignoring entry...")
             continue
-        info = service["info"]
-        if "title" not in info:
-            logger.debug(f"\tMissing 'title' tag in 'hit.info'? Ignoring entry...")
+        title = info.get("title")
+        if title is None:
+            logger.debug("\tMissing 'title' tag in 'hit.info'? Ignoring entry...")
             continue
-        title = info["title"]
-        logger.debug(f"\n{index} - '{title}':")
-        if "x-translator" not in info:
-            logger.debug(f"\tMissing 'x-translator' tag in 'hit.info'? Ignoring entry...")
+        logger.debug("\n%d - '%s':", index, title)
+        x_translator = info.get("x-translator")
+        if x_translator is None:
+            logger.debug("\tMissing 'x-translator' tag in 'hit.info'? Ignoring entry...")
             continue
-        x_translator = info["x-translator"]
-        if "component" not in x_translator:
-            logger.debug(f"\tMissing 'component' tag in 'hit.info.x-translator'? Ignoring entry...")
+        component = x_translator.get("component")
+        if component is None:
+            logger.debug("\tMissing 'component' tag in 'hit.info.x-translator'? Ignoring entry...")
             continue
-        component = x_translator["component"]
-        if "x-trapi" not in info:
-            logger.debug(f"\tMissing 'x-trapi' tag in 'hit.info'? Ignoring entry...")
+        x_trapi = info.get("x-trapi")
+        if x_trapi is None:
+            logger.debug("\tMissing 'x-trapi' tag in 'hit.info'? Ignoring entry...")
             continue
-        x_trapi = info["x-trapi"]
 
         if component == "KP":
-            if "test_data_location" not in x_trapi:
-                logger.debug(f"\tMissing 'test_data_location' tag in 'hit.info.x-trapi'? Ignoring entry...")
+            test_data_location = x_trapi.get("test_data_location")
+            if test_data_location is None:
+                logger.debug("\tMissing 'test_data_location' tag in 'hit.info.x-trapi'? Ignoring entry...")
                 continue
             else:
-                test_data_location = x_trapi["test_data_location"]
-                logger.debug(f"\t'hit.info.x-trapi.test_data_location': '{test_data_location}'")
+                logger.debug("\t'hit.info.x-trapi.test_data_location': '%s'", test_data_location)
         else:
-            logger.debug(f"\tIs an ARA?")
+            logger.debug("\tIs an ARA?")
 
 
 def test_empty_json_data():
@@ -522,17 +503,18 @@ def test_empty_json_data():
     assert not value
 
 
-_TEST_JSON_DATA = {
-        "testing": {
-            "one": {
-                "two": {
+# read-only, since shared by the tag path tests below
+_TEST_JSON_DATA = MappingProxyType({
+        "testing": MappingProxyType({
+            "one": MappingProxyType({
+                "two": MappingProxyType({
                     "three": "The End!"
-                },
+                }),
 
                 "another_one": "for_fun"
-            }
-        }
-    }
+            })
+        })
+    })
 
 
 def test_valid_tag_path():
@@ -713,405 +695,296 @@ def shared_test_extract_component_test_data_metadata_from_registry(
         assert_tag(service_metadata, service_id, "trapi_version")
 
 
-# extract_kp_test_data_metadata_from_registry(registry_data) -> Dict[str, str]
-@pytest.mark.parametrize(
-    "metadata,service_id,service_url",
-    [
-        (  # Query 0 - Valid 'hits' entry with non-empty 'info.x-trapi.test_data_location'
-            {
-                "hits": [
-                    {
-                        'info': {
-                            'contact': {
-                                'email': 'translator@broadinstitute.org',
-                                'name': 'Molecular Data Provider',
-                                'x-role': 'responsible organization'
-                            },
-                            'description': 'Molecular Data Provider for NCATS Biomedical Translator',
-                            'title': 'MolePro',
-                            'version': f'{DEF_M_M_TRAPI}.0.0',
-                            'x-translator': {
-                                'biolink-version': '3.2.0',
-                                'component': 'KP',
-                                'infores': f"infores:{KP_INFORES}",
-                                'team': ['Molecular Data Provider']
-                            },
-                            'x-trapi': {
-                                'test_data_location': KP_TEST_DATA_URL,
-                                'version': DEF_M_M_P_TRAPI
-                            }
+_EXTRACT_CASES = (
+    (  # KP Query 0 - Valid 'hits' entry with non-empty 'info.x-trapi.test_data_location'
+        "KP",
+        {
+            "hits": [
+                {
+                    'info': {
+                        'contact': {
+                            'email': 'translator@broadinstitute.org',
+                            'name': 'Molecular Data Provider',
+                            'x-role': 'responsible organization'
                         },
-                        'servers': KP_SERVERS_BLOCK
-                    }
-                ]
-            },
-            f'molepro,{DEF_M_M_P_TRAPI},3.2.0,production',  # KP test_data_location, converted to Github raw data link
-            # 'production' endpoint url preferred for testing
-            f"{PRODUCTION_KP_BASEURL}{DEF_M_M_TRAPI}"
-        ),
-        (   # Query 1 - Empty "hits" List
-            {
-                "hits": []
-            },
-            None, None
-        ),
-        (   # Query 2 - Empty "hits" entry
-            {
-                "hits": [{}]
-            },
-            None, None
-        ),
-        (   # Query 3 - "hits" entry with missing 'component' (and 'infores')
-            {
-                "hits": [
-                    {
-                        "info": {
+                        'description': 'Molecular Data Provider for NCATS Biomedical Translator',
+                        'title': 'MolePro',
+                        'version': f'{DEF_M_M_TRAPI}.0.0',
+                        'x-translator': {
+                            'biolink-version': '3.2.0',
+                            'component': 'KP',
+                            'infores': f"infores:{KP_INFORES}",
+                            'team': ['Molecular Data Provider']
+                        },
+                        'x-trapi': {
+                            'test_data_location': KP_TEST_DATA_URL,
+                            'version': DEF_M_M_P_TRAPI
                         }
+                    },
+                    'servers': KP_SERVERS_BLOCK
+                }
+            ]
+        },
+        f'molepro,{DEF_M_M_P_TRAPI},3.2.0,production',  # KP test_data_location, converted to Github raw data link
+        # 'production' endpoint url preferred for testing
+        PRODUCTION_KP_SERVER_URL
+    ),
+    (   # KP Query 1 - Empty "hits" List
+        "KP",
+        {
+            "hits": []
+        },
+        None, None
+    ),
+    (   # KP Query 2 - Empty "hits" entry
+        "KP",
+        {
+            "hits": [{}]
+        },
+        None, None
+    ),
+    (   # KP Query 3 - "hits" entry with missing 'component' (and 'infores')
+        "KP",
+        {
+            "hits": [
+                {
+                    "info": {
                     }
-                ]
-            },
-            None, None
-        ),
-        (   # Query 4 - "hits" ARA component entry
-            {
-                "hits": [
-                    {
-                        "info": {
-                            "x-translator": {
-                                "infores": "infores:some-ara",
-                                "component": "ARA"
-                            }
+                }
+            ]
+        },
+        None, None
+    ),
+    (   # KP Query 4 - "hits" ARA component entry
+        "KP",
+        {
+            "hits": [
+                {
+                    "info": {
+                        "x-translator": {
+                            "infores": "infores:some-ara",
+                            "component": "ARA"
                         }
                     }
-                ]
-            },
-            None, None
-        ),
-        (   # Query 5 - "hits" KP component entry with missing 'infores'
-            {
-                "hits": [
-                    {
-                        "info": {
-                            "x-translator": {
-                                "infores": "infores:some-kp"
-                            }
+                }
+            ]
+        },
+        None, None
+    ),
+    (   # KP Query 5 - "hits" KP component entry with missing 'infores'
+        "KP",
+        {
+            "hits": [
+                {
+                    "info": {
+                        "x-translator": {
+                            "infores": "infores:some-kp"
                         }
                     }
-                ]
-            },
-            None, None
-        ),
-        (   # Query 6 - "hits" KP component entry with missing 'info.x-trapi'
-            {
-                "hits": [
-                    {
-                        "info": {
-                            "title": "KP component entry with missing info.x-trapi",
-                            "x-translator": {
-                                "infores": "infores:some-kp",
-                                "component": "KP"
-                            }
+                }
+            ]
+        },
+        None, None
+    ),
+    (   # KP Query 6 - "hits" KP component entry with missing 'info.x-trapi'
+        "KP",
+        {
+            "hits": [
+                {
+                    "info": {
+                        "title": "KP component entry with missing info.x-trapi",
+                        "x-translator": {
+                            "infores": "infores:some-kp",
+                            "component": "KP"
                         }
                     }
-                ]
-            },
-            None, None
-        ),
-        (   # Query 7 - "hits" KP component entry with missing info.x-trapi.test_data_location tag value
-            {
-                "hits": [
-                    {
-                        "info": {
-                            "title": "KP component entry with missing info.x-trapi.test_data_location tag value",
-                            "x-translator": {
-                                "infores": "infores:some-kp",
-                                "component": "KP"
-                            },
-                            "x-trapi": {
+                }
+            ]
+        },
+        None, None
+    ),
+    (   # KP Query 7 - "hits" KP component entry with missing info.x-trapi.test_data_location tag value
+        "KP",
+        {
+            "hits": [
+                {
+                    "info": {
+                        "title": "KP component entry with missing info.x-trapi.test_data_location tag value",
+                        "x-translator": {
+                            "infores": "infores:some-kp",
+                            "component": "KP"
+                        },
+                        "x-trapi": {
 
-                            }
                         }
                     }
-                ]
-            },
-            None, None
-        )
-    ]
-)
-def test_extract_kp_test_data_metadata_from_registry(metadata: Dict, service_id: str, service_url: str):
-    shared_test_extract_component_test_data_metadata_from_registry(metadata, service_id, service_url, "KP")
-
-
-# extract_kp_test_data_metadata_from_registry(registry_data) -> Dict[str, str]
-@pytest.mark.parametrize(
-    "metadata,service_id,service_url",
-    [
-        (  # Query 0 - Valid 'hits' ARA entry with non-empty 'info.x-trapi.test_data_location'
-            {
-                "hits": [
-                    {
-                        'info': {
-                            'contact': {
-                                'email': 'edeutsch@systemsbiology.org'
-                            },
-                            'description': f'ARA TRAPI {DEF_M_M_TRAPI} endpoint' +
-                                           ' for the NCATS Biomedical Translator Reasoner',
-                            'license': {
-                                'name': 'Apache 2.0',
-                                'url': 'http://www.apache.org/licenses/LICENSE-2.0.html'
-                            },
-                            'termsOfService': 'https://github.com/RTXteam/RTX/blob/master/LICENSE',
-                            'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                            'version': f"{DEF_M_M_P_TRAPI}",
-                            'x-translator': {
-                                'biolink-version': '3.2.0',
-                                'component': 'ARA',
-                                'infores': f"infores:{ARA_INFORES}",
-                                'team': ['Expander Agent']
-                            },
-                            'x-trapi': {
-                                'test_data_location': ARA_TEST_DATA_URL,
-                                'version': f"{DEF_M_M_P_TRAPI}"
-                            }
+                }
+            ]
+        },
+        None, None
+    ),
+    (  # ARA Query 0 - Valid 'hits' ARA entry with non-empty 'info.x-trapi.test_data_location'
+        "ARA",
+        {
+            "hits": [
+                {
+                    'info': {
+                        'contact': {
+                            'email': 'edeutsch@systemsbiology.org'
                         },
-                        'servers': ARA_SERVERS_BLOCK
-                    }
-                ]
-            },
-            f'{ARA_INFORES},{DEF_M_M_P_TRAPI},3.2.0,production',
-            PRODUCTION_ARA_SERVER_URL
-        )
-    ]
+                        'description': f'ARA TRAPI {DEF_M_M_TRAPI} endpoint' +
+                                       ' for the NCATS Biomedical Translator Reasoner',
+                        'license': {
+                            'name': 'Apache 2.0',
+                            'url': 'http://www.apache.org/licenses/LICENSE-2.0.html'
+                        },
+                        'termsOfService': 'https://github.com/RTXteam/RTX/blob/master/LICENSE',
+                        'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
+                        'version': f"{DEF_M_M_P_TRAPI}",
+                        'x-translator': {
+                            'biolink-version': '3.2.0',
+                            'component': 'ARA',
+                            'infores': f"infores:{ARA_INFORES}",
+                            'team': ['Expander Agent']
+                        },
+                        'x-trapi': {
+                            'test_data_location': ARA_TEST_DATA_URL,
+                            'version': f"{DEF_M_M_P_TRAPI}"
+                        }
+                    },
+                    'servers': ARA_SERVERS_BLOCK
+                }
+            ]
+        },
+        f'{ARA_INFORES},{DEF_M_M_P_TRAPI},3.2.0,production',
+        PRODUCTION_ARA_SERVER_URL
+    )
 )
-def test_extract_ara_test_data_metadata_from_registry(metadata: Dict, service_id: str, service_url: str):
-    shared_test_extract_component_test_data_metadata_from_registry(metadata, service_id, service_url, "ARA")
 
 
-# validate_testable_resource(index, service, component) -> Optional[Dict[str, Union[str, List, Dict]]]
-@pytest.mark.parametrize(
-    "query",
-    [
-        (  # query 0 - 'empty' service dictionary
-            dict(),  # service
-            False,   # True if expecting that resource_metadata is not None; False otherwise
-            ""       # expected 'url'
+# extract_component_test_metadata_from_registry(registry_data, target_component_type) -> Dict[str, Dict]
+@pytest.mark.parametrize("component,metadata,service_id,service_url", _EXTRACT_CASES)
+def test_extract_component_test_data_metadata_from_registry(
+        component: str,
+        metadata: Dict,
+        service_id: str,
+        service_url: str
+):
+    shared_test_extract_component_test_data_metadata_from_registry(metadata, service_id, service_url, component)
 
-        ),
-        (   # query 1 - minimally 'complete' service dictionary implies that the resource is amenable to testing
-            {
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': ARA_TEST_DATA_URL
-                    }
-                },
-                'servers': [DEVELOPMENT_ARA_SERVER]
-            },       # service
-            True,    # True if expecting that resource_metadata is not None; False otherwise
 
-            # expected testable endpoint (only 'development' available)
-            DEVELOPMENT_ARA_SERVER_URL
-        ),
-        (
-            {  # query 2. missing service 'title' - won't return any resource_metadata
-                'info': {
-                    # 'title': f'ARA Translator Reasoner - TRAPI {CURRENT_DEFAULT_MAJOR_MINOR_PATCH_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': ARA_TEST_DATA_URL
-                    }
-                },
-                'servers': [DEVELOPMENT_ARA_SERVER]
-            },      # service
-            False,  # True if expecting that resource_metadata is not None; False otherwise
-            ""      # expected 'url'
-        ),
-        (
-            {  # query 3. missing 'infores' - won't return any resource_metadata
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        # 'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': ARA_TEST_DATA_URL
-                    }
-                },
-                'servers': [DEVELOPMENT_ARA_SERVER]
-            },      # service
-            False,  # True if expecting that resource_metadata is not None; False otherwise
-            ""      # expected 'url'
-        ),
-        (
-            {  # query 4. missing 'servers' block - won't return any resource_metadata
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': ARA_TEST_DATA_URL
-                    }
-                }
-            },      # service
-            False,  # True if expecting that resource_metadata is not None; False otherwise
-            ""      # expected 'url'
-        ),
-        (
-            {  # query 5. empty 'servers' block - won't return any resource_metadata
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': ARA_TEST_DATA_URL
-                    }
-                },
-                'servers': [],
-            },      # service
-            False,  # True if expecting that resource_metadata is not None; False otherwise
-            ""      # expected 'url'
-        ),
-        (
-            {  # query 6. missing 'test_data_location' (i.e. not testable!)
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        # 'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        # 'test_data_location': ARA_TEST_DATA_URL
-                    }
-                },
-                'servers': [DEVELOPMENT_ARA_SERVER]
-            },      # service
-            False,  # True if expecting that resource_metadata is not None; False otherwise
-            ""      # expected 'url'
-        ),
-        (
-            {   # query 7. testable, simple single testdata URL; 'production' endpoint prioritized
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': ARA_TEST_DATA_URL
-                    }
-                },
-                'servers': ARA_SERVERS_BLOCK
-            },       # service
-            True,    # True if expecting that resource_metadata is not None; False otherwise
-            PRODUCTION_ARA_SERVER_URL  # expected 'url' is 'production'
-        ),
-        (
-            {   # query 8. testable, simple single testdata URL; 'staging' endpoint has greatest precedence
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': ARA_TEST_DATA_URL
-                    }
-                },
-                'servers': [DEVELOPMENT_ARA_SERVER, PRODUCTION_ARA_SERVER]
-            },       # service
-            True,    # True if expecting that resource_metadata is not None; False otherwise
-            PRODUCTION_ARA_SERVER_URL  # expected 'url' is 'production'
-        ),
-        (
-            {   # query 9. testable, list of URLs, uses only first one; 'production' endpoint prioritized
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': [
-                            ARA_TEST_DATA_URL
-                        ]
-                    }
-                },
-                'servers': ARA_SERVERS_BLOCK
-            },       # service
-            True,    # True if expecting that resource_metadata is not None; False otherwise
+_ARA_SERVICE_TITLE = f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}'
+_ARA_SERVICE_INFORES = f"infores:{ARA_INFORES}"
 
-            # expected 'url' is currently 'production' with unclassified list of data urls
-            PRODUCTION_ARA_SERVER_URL
-        ),
-        (
-            {   # query 10. testable, x-maturity dictionary with default; 'production' endpoint prioritized
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': {
-                            "default": {
-                                'url': ARA_TEST_DATA_URL
-                            }
-                        }
-                    }
-                },
-                'servers': ARA_SERVERS_BLOCK
-            },       # service
-            True,    # True if expecting that resource_metadata is not None; False otherwise
 
-            # expected 'url' is currently 'production' since it can use 'default' data
-            PRODUCTION_ARA_SERVER_URL
-        ),
-        (
-            {   # query 11. testable, x-maturity dictionary with 'testing' x-maturity
-                #           but without default; 'testing' endpoint prioritized
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': {
-                            "testing": {
-                                'url': ARA_TEST_DATA_URL
-                            }
-                        }
-                    }
-                },
-                'servers': ARA_SERVERS_BLOCK
-            },       # service
-            True,    # True if expecting that resource_metadata is not None; False otherwise
-            TESTING_ARA_SERVER_URL  # expected 'url' is the 'testing' endpoint
+def _ara_service(
+        servers: Optional[Union[Tuple, List]] = None,
+        title: Optional[str] = _ARA_SERVICE_TITLE,
+        infores: Optional[str] = _ARA_SERVICE_INFORES,
+        test_data_location: Optional[Union[str, List, Dict]] = ARA_TEST_DATA_URL
+) -> Dict:
+    """
+    Builds a minimal ARA service entry for validate_testable_resource() test cases.
+
+    :param servers: Optional[Union[Tuple, List]], 'servers' block of the entry; omitted if None
+    :param title: Optional[str], 'info.title' of the entry; omitted if None
+    :param infores: Optional[str], 'info.x-translator.infores' of the entry; omitted if None
+    :param test_data_location: Optional[Union[str, List, Dict]], 'info.x-trapi.test_data_location'; omitted if None
+    :return: Dict, service entry
+    """
+    info: Dict = dict()
+    if title is not None:
+        info['title'] = title
+    info['x-translator'] = {'infores': infores} if infores is not None else {}
+    info['x-trapi'] = {'test_data_location': test_data_location} if test_data_location is not None else {}
+    service: Dict = {'info': info}
+    if servers is not None:
+        service['servers'] = servers
+    return service
+
+
+_VALIDATE_TESTABLE_CASES = (
+    (  # query 0 - 'empty' service dictionary
+        dict(),  # service
+        False,   # True if expecting that resource_metadata is not None; False otherwise
+        ""       # expected 'url'
+    ),
+    (   # query 1 - minimally 'complete' service dictionary implies that the resource is amenable to testing
+        _ara_service(servers=[DEVELOPMENT_ARA_SERVER]),
+        True,    # True if expecting that resource_metadata is not None; False otherwise
+
+        # expected testable endpoint (only 'development' available)
+        DEVELOPMENT_ARA_SERVER_URL
+    ),
+    (   # query 2. missing service 'title' - won't return any resource_metadata
+        _ara_service(servers=[DEVELOPMENT_ARA_SERVER], title=None),
+        False,
+        ""
+    ),
+    (   # query 3. missing 'infores' - won't return any resource_metadata
+        _ara_service(servers=[DEVELOPMENT_ARA_SERVER], infores=None),
+        False,
+        ""
+    ),
+    (   # query 4. missing 'servers' block - won't return any resource_metadata
+        _ara_service(),
+        False,
+        ""
+    ),
+    (   # query 5. empty 'servers' block - won't return any resource_metadata
+        _ara_service(servers=[]),
+        False,
+        ""
+    ),
+    (   # query 6. missing 'test_data_location' (i.e. not testable!)
+        _ara_service(servers=[DEVELOPMENT_ARA_SERVER], infores=None, test_data_location=None),
+        False,
+        ""
+    ),
+    (   # query 7. testable, simple single testdata URL; 'production' endpoint prioritized
+        _ara_service(servers=ARA_SERVERS_BLOCK),
+        True,
+        PRODUCTION_ARA_SERVER_URL  # expected 'url' is 'production'
+    ),
+    (   # query 8. testable, simple single testdata URL; 'staging' endpoint has greatest precedence
+        _ara_service(servers=[DEVELOPMENT_ARA_SERVER, PRODUCTION_ARA_SERVER]),
+        True,
+        PRODUCTION_ARA_SERVER_URL  # expected 'url' is 'production'
+    ),
+    (   # query 9. testable, list of URLs, uses only first one; 'production' endpoint prioritized
+        _ara_service(servers=ARA_SERVERS_BLOCK, test_data_location=[ARA_TEST_DATA_URL]),
+        True,
+
+        # expected 'url' is currently 'production' with unclassified list of data urls
+        PRODUCTION_ARA_SERVER_URL
+    ),
+    (   # query 10. testable, x-maturity dictionary with default; 'production' endpoint prioritized
+        _ara_service(servers=ARA_SERVERS_BLOCK, test_data_location={"default": {'url': ARA_TEST_DATA_URL}}),
+        True,
+
+        # expected 'url' is currently 'production' since it can use 'default' data
+        PRODUCTION_ARA_SERVER_URL
+    ),
+    (   # query 11. testable, x-maturity dictionary with 'testing' x-maturity
+        #           but without default; 'testing' endpoint prioritized
+        _ara_service(servers=ARA_SERVERS_BLOCK, test_data_location={"testing": {'url': ARA_TEST_DATA_URL}}),
+        True,
+        TESTING_ARA_SERVER_URL  # expected 'url' is the 'testing' endpoint
+    ),
+    (   # query 12. testable, x-maturity dictionary with 'testing' x-maturity but without default;
+        # but since 'testing' servers endpoint is not specified, cannot test... return None
+        _ara_service(
+            servers=[PRODUCTION_ARA_SERVER, PRODUCTION_ARA_SERVER, DEVELOPMENT_ARA_SERVER],
+            test_data_location={"testing": {'url': ARA_TEST_DATA_URL}}
         ),
-        (
-            {   # query 12. testable, x-maturity dictionary with 'testing' x-maturity but without default;
-                # but since 'testing' servers endpoint is not specified, cannot test... return None
-                'info': {
-                    'title': f'ARA Translator Reasoner - TRAPI {DEF_M_M_P_TRAPI}',
-                    'x-translator': {
-                        'infores': f"infores:{ARA_INFORES}",
-                    },
-                    'x-trapi': {
-                        'test_data_location': {
-                            "testing": {
-                                'url': ARA_TEST_DATA_URL
-                            }
-                        }
-                    }
-                },
-                'servers': [PRODUCTION_ARA_SERVER,PRODUCTION_ARA_SERVER,DEVELOPMENT_ARA_SERVER]
-            },      # service
-            False,  # True if expecting that resource_metadata is not None; False otherwise
-            ""      # expected 'url'
-        )
-    ]
+        False,
+        ""
+    )
 )
+
+
+# validate_testable_resource(index, service, component) -> Optional[Dict[str, Union[str, List, Dict]]]
+@pytest.mark.parametrize("query", _VALIDATE_TESTABLE_CASES)
 def test_validate_testable_resource(query: Tuple):
     resource_metadata: Optional[Dict[str, Union[str, List]]] = \
         validate_testable_resource(1, query[0], "ARA")
@@ -1404,7 +1277,7 @@ def test_get_translator_ara_test_data_metadata():
         "No 'ARA' services found with a 'test_data_location' value in the Translator SmartAPI Registry?"
 
 
-@pytest.mark.skipif(MOCK_REGISTRY, reason="Test needs the REAL Registry")
+@pytest.mark.skipif(is_mock_registry(), reason="Test needs the REAL Registry")
 def test_get_one_specific_target_ara():
     registry_data: Dict = get_the_registry_data()
     # we filter on the 'aragon' but this only passes with the REAL registry?
@@ -1418,7 +1291,7 @@ def test_get_one_specific_target_ara():
         assert service["x_maturity"] == "production"
 
 
-@pytest.mark.skipif(MOCK_REGISTRY, reason="Test needs the REAL Registry")
+@pytest.mark.skipif(is_mock_registry(), reason="Test needs the REAL Registry")
 def test_get_one_specific_target_x_maturity_in_a_target_ara():
     registry_data: Dict = get_the_registry_data()
     # we filter on the 'aragorn' but this only passes with the REAL registry?
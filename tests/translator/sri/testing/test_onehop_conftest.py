@@ -0,0 +1,200 @@
+"""
+Unit tests for the One Hop test parametrization logic of tests/onehop/conftest.py
+"""
+from typing import Optional, List, Dict
+
+from tests.onehop import conftest
+from tests.onehop.conftest import generate_trapi_kp_tests, generate_trapi_ara_tests
+
+MOLEPRO_TEST_DATA_URL = "https://raw.githubusercontent.com/broadinstitute/molecular-data-provider/" + \
+                        "master/test/data/MolePro-test-data.json"
+SRI_KG_TEST_DATA_URL = "https://raw.githubusercontent.com/TranslatorSRI/sri-kg/master/test-data.json"
+ARAX_TEST_CONFIG_URL = "https://raw.githubusercontent.com/RTXteam/RTX/master/code/ARAX/arax_kps.json"
+ARAGORN_TEST_CONFIG_URL = "https://raw.githubusercontent.com/ranking-agent/aragorn/main/aragorn_kps.json"
+ARAGORN_OTHER_TEST_CONFIG_URL = "https://raw.githubusercontent.com/ranking-agent/aragorn/main/robokop_kps.json"
+
+MOLEPRO_PRODUCTION_URL = "https://molepro-trapi.transltr.io/molepro/trapi/v1.4"
+MOLEPRO_STAGING_URL = "https://molepro-trapi.ci.transltr.io/molepro/trapi/v1.3"
+
+
+def _edge(subject_id: str, object_id: str) -> Dict:
+    return {
+        "subject_category": "biolink:SmallMolecule",
+        "object_category": "biolink:Disease",
+        "predicate": "biolink:treats",
+        "subject_id": subject_id,
+        "object_id": object_id
+    }
+
+
+# Test data file content, built afresh on each access, as if it was retrieved from the web
+_TEST_DATA_FILES = {
+    MOLEPRO_TEST_DATA_URL: lambda: {
+        "infores": "molepro",
+        "edges": [_edge("CHEBI:3002", "MESH:D001249"), _edge("CHEBI:6801", "MONDO:0005148")]
+    },
+    SRI_KG_TEST_DATA_URL: lambda: {
+        "infores": "sri-kg",
+        "edges": [_edge("CHEBI:15365", "MONDO:0005044")]
+    },
+    ARAX_TEST_CONFIG_URL: lambda: {
+        "infores": "arax",
+        "KPs": ["infores:molepro"]
+    },
+    ARAGORN_TEST_CONFIG_URL: lambda: {
+        "infores": "aragorn",
+        "KPs": ["infores:molepro", "infores:sri-kg"]
+    },
+    ARAGORN_OTHER_TEST_CONFIG_URL: lambda: {
+        "infores": "robokop",
+        "KPs": ["infores:sri-kg", "infores:molepro"]
+    }
+}
+
+
+class MockConfig:
+
+    def __init__(self, options: Optional[Dict] = None):
+        self.options = options if options else dict()
+
+    def getoption(self, name: str, default=None):
+        return self.options.get(name, default)
+
+
+class MockMetafunc:
+
+    def __init__(self, fixturenames: Optional[List[str]] = None, options: Optional[Dict] = None):
+        self.config = MockConfig(options)
+        self.fixturenames = fixturenames if fixturenames else []
+        self.parametrizations: Dict[str, Dict] = dict()
+
+    def parametrize(self, argnames: str, argvalues, ids=None):
+        self.parametrizations[argnames] = {
+            "argvalues": list(argvalues),
+            "ids": list(ids) if ids is not None else None
+        }
+
+
+def _component_release_metadata(url: str, x_maturity: str, trapi_version: str, test_data_location: List[str]) -> Dict:
+    return {
+        'url': url,
+        'x_maturity': x_maturity,
+        'trapi_version': trapi_version,
+        'biolink_version': "suppress",
+        'test_data_location': test_data_location
+    }
+
+
+def _kp_metadata() -> Dict:
+    return {
+        "molepro,1.4.0,suppress,production": _component_release_metadata(
+            MOLEPRO_PRODUCTION_URL, "production", "1.4.0", [MOLEPRO_TEST_DATA_URL]
+        ),
+        "sri-kg,1.4.0,suppress,production": _component_release_metadata(
+            "https://sri-kg.transltr.io/trapi/v1.4", "production", "1.4.0", [SRI_KG_TEST_DATA_URL]
+        ),
+        "molepro,1.3.0,suppress,staging": _component_release_metadata(
+            MOLEPRO_STAGING_URL, "staging", "1.3.0", [MOLEPRO_TEST_DATA_URL]
+        )
+    }
+
+
+def _mock_test_data_retrieval(monkeypatch) -> Dict[str, int]:
+    retrievals: Dict[str, int] = dict()
+
+    def mock_get_remote_test_data_file(url: str) -> Dict:
+        retrievals[url] = retrievals.get(url, 0) + 1
+        return _TEST_DATA_FILES[url]()
+
+    monkeypatch.setattr(conftest, "get_remote_test_data_file", mock_get_remote_test_data_file)
+    monkeypatch.setattr(conftest, "_remote_test_data_files", dict())
+
+    return retrievals
+
+
+def test_kp_releases_sharing_a_test_data_location(monkeypatch):
+    retrievals: Dict[str, int] = _mock_test_data_retrieval(monkeypatch)
+
+    edges, kp_source_edges = generate_trapi_kp_tests(MockMetafunc(), _kp_metadata())
+
+    # the shared test data file is only retrieved once...
+    assert retrievals == {MOLEPRO_TEST_DATA_URL: 1, SRI_KG_TEST_DATA_URL: 1}
+
+    # ...but each release is tested with its own annotated copy of its edges
+    molepro_edges: List[Dict] = kp_source_edges["infores:molepro"]
+    assert len({id(edge) for edge in molepro_edges}) == 4
+    assert [(edge['url'], edge['x_maturity'], edge['trapi_version'], edge['idx']) for edge in molepro_edges] == [
+        (MOLEPRO_PRODUCTION_URL, "production", "1.4.0", 0),
+        (MOLEPRO_PRODUCTION_URL, "production", "1.4.0", 1),
+        (MOLEPRO_STAGING_URL, "staging", "1.3.0", 0),
+        (MOLEPRO_STAGING_URL, "staging", "1.3.0", 1)
+    ]
+
+    # the cached test data file content itself is never annotated
+    assert 'url' not in conftest._remote_test_data_files[MOLEPRO_TEST_DATA_URL]['edges'][0]
+
+
+def test_kp_edge_ids(monkeypatch):
+    _mock_test_data_retrieval(monkeypatch)
+
+    metafunc = MockMetafunc(fixturenames=["kp_trapi_case"], options={"teststyle": "by_subject"})
+    generate_trapi_kp_tests(metafunc, _kp_metadata())
+
+    # the KP test edges are numbered by their sequence in each KP release test data source
+    assert metafunc.parametrizations["kp_trapi_case"]["ids"] == [
+        "molepro#0",
+        "molepro#1",
+        "sri-kg#0",
+        "molepro#0",
+        "molepro#1"
+    ]
+
+
+def test_ara_edge_ids(monkeypatch):
+    _mock_test_data_retrieval(monkeypatch)
+
+    _, kp_source_edges = generate_trapi_kp_tests(MockMetafunc(), _kp_metadata())
+
+    ara_metadata: Dict = {
+        # two ARA releases sharing an ARA test configuration with a single KP
+        "arax,1.4.0,suppress,production": _component_release_metadata(
+            "https://arax.ncats.io/api/arax/v1.4", "production", "1.4.0", [ARAX_TEST_CONFIG_URL]
+        ),
+        "arax,1.4.0,suppress,staging": _component_release_metadata(
+            "https://arax.ci.transltr.io/api/arax/v1.4", "staging", "1.4.0", [ARAX_TEST_CONFIG_URL]
+        ),
+        # an ARA release with two test configurations, both with the same KPs
+        "aragorn,1.4.0,suppress,production": _component_release_metadata(
+            "https://aragorn.transltr.io/aragorn", "production", "1.4.0",
+            [ARAGORN_TEST_CONFIG_URL, ARAGORN_OTHER_TEST_CONFIG_URL]
+        )
+    }
+
+    metafunc = MockMetafunc(fixturenames=["ara_trapi_case"])
+    generate_trapi_ara_tests(metafunc, kp_source_edges, ara_metadata)
+
+    # the ARA test edges are numbered in sequence within the
+    # KP edges added for each KP of each ARA test configuration
+    parametrization: Dict = metafunc.parametrizations["ara_trapi_case"]
+    assert parametrization["ids"] == [
+        "arax|molepro#0",
+        "arax|molepro#1",
+        "arax|molepro#2",
+        "arax|molepro#3",
+        "arax|molepro#0",
+        "arax|molepro#1",
+        "arax|molepro#2",
+        "arax|molepro#3",
+        "aragorn|molepro#0",
+        "aragorn|molepro#1",
+        "aragorn|molepro#2",
+        "aragorn|molepro#3",
+        "aragorn|sri-kg#0",
+        "aragorn|sri-kg#0",
+        "aragorn|molepro#0",
+        "aragorn|molepro#1",
+        "aragorn|molepro#2",
+        "aragorn|molepro#3"
+    ]
+    assert [edge['ara_source'] for edge in parametrization["argvalues"]][8:] == \
+           ["infores:aragorn"] * 5 + ["infores:robokop"] * 5
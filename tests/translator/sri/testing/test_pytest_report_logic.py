@@ -16,7 +16,7 @@ import pytest
 import logging
 
 # Note that this test module assumes the use of the
-# MOCK_TRANSLATOR_SMARTAPI_REGISTRY_METADATA and a
+# get_mock_registry_metadata() Registry data and a
 # FileTestDatabase, which will be initialized
 # during the module import of the OneHopTestHarness below
 from sri_testing.translator.sri.testing.report_db import get_test_report_database, TestReport
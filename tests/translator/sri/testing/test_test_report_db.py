@@ -1,7 +1,13 @@
+import json
 from os.path import sep
 from datetime import datetime
+from typing import Dict
+from collections import defaultdict, Counter
+
+import pytest
+
 from tests.onehop import TEST_RESULTS_DB, ONEHOP_TEST_DIRECTORY
-from sri_testing.translator.sri.testing.report_db import TestReportDatabase, TestReport
+from sri_testing.translator.sri.testing.report_db import TestReportDatabase, TestReport, encode_report_json
 
 TEST_DATABASE = "test-database"
 
@@ -28,3 +34,35 @@ def test_test_report_creation():
     assert test_report.get_identifier() == test_id
     assert test_report.get_database() == trd
     assert test_report.get_root_path() == f"{ONEHOP_TEST_DIRECTORY}{sep}test-database{sep}{test_id}"
+
+
+def test_encode_report_json():
+    ara_summary: Dict = defaultdict(dict)
+    ara_summary["arax"]["kps"] = {"molepro": {"no_of_edges": 2}}
+    kp_summary: Dict = defaultdict(lambda: defaultdict(dict))
+    kp_summary["molepro"]["results"]["by_subject"] = Counter(passed=1, failed=1)
+    document: Dict = {
+        "KP": kp_summary,
+        "ARA": ara_summary,
+        "exclude_tests": {"RSE"},
+        "versions": ("1.4.0", "3.2.0"),
+        "edges": frozenset([0]),
+        1: "non-str key"
+    }
+    expected: Dict = {
+        "KP": {"molepro": {"results": {"by_subject": {"passed": 1, "failed": 1}}}},
+        "ARA": {"arax": {"kps": {"molepro": {"no_of_edges": 2}}}},
+        "exclude_tests": ["RSE"],
+        "versions": ["1.4.0", "3.2.0"],
+        "edges": [0],
+        "1": "non-str key"
+    }
+    assert json.loads(encode_report_json(document)) == expected
+
+    # the pretty printed report document encodes the same JSON object
+    assert json.loads(encode_report_json(document, indent=True)) == expected
+
+
+def test_encode_report_json_of_unserializable_object():
+    with pytest.raises(TypeError):
+        encode_report_json({"not-serializable": object()})